@@ -8,13 +8,17 @@ Handles batch document upload and processing through SQS queue.
 """
 
 import glob as glob_module
+import gzip
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from .manifest_parser import parse_manifest
@@ -22,6 +26,22 @@ from .stack_info import StackInfo
 
 logger = logging.getLogger(__name__)
 
+# Maximum documents uploaded, copied or validated concurrently
+MAX_DOCUMENT_WORKERS = 32
+
+# Maximum batch metadata objects fetched concurrently when listing batches
+MAX_METADATA_WORKERS = 10
+
+# Multipart settings for document uploads. Per-file concurrency is kept low
+# because documents are already uploaded in parallel; the S3 connection pool
+# is sized for every worker running a full multipart upload at once.
+DOCUMENT_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+
 
 class BatchProcessor:
     """Processes batches of documents for IDP pipeline"""
@@ -45,7 +65,16 @@ class BatchProcessor:
         self.region = region
 
         # Initialize AWS clients
-        self.s3 = boto3.client("s3", region_name=region)
+        # Size the connection pool for concurrent document processing, where
+        # each document upload may run its own multipart threads
+        self.s3 = boto3.client(
+            "s3",
+            region_name=region,
+            config=Config(
+                max_pool_connections=MAX_DOCUMENT_WORKERS
+                * DOCUMENT_TRANSFER_CONFIG.max_concurrency
+            ),
+        )
         self.dynamodb = boto3.resource("dynamodb", region_name=region)
 
         # Get stack resources
@@ -68,7 +97,7 @@ class BatchProcessor:
         Process batch of documents from manifest
 
         Args:
-            manifest_path: Path to manifest file (CSV or JSON)
+            manifest_path: Path to manifest file (CSV, JSON or JSONL)
             output_prefix: Prefix for output organization
             batch_id: Optional custom batch ID (auto-generated if not provided)
 
@@ -222,38 +251,37 @@ class BatchProcessor:
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
-        for doc in documents:
-            try:
-                # Upload baseline if specified
-                if doc.get("baseline_source"):
+        if documents:
+            # S3 requests are I/O bound, so process documents concurrently and
+            # collect outcomes in manifest order
+            max_workers = min(MAX_DOCUMENT_WORKERS, len(documents))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._process_single_document, doc, batch_id, base_dir
+                    )
+                    for doc in documents
+                ]
+
+                for doc, future in zip(documents, futures):
                     try:
-                        self._upload_baseline(doc, batch_id, base_dir)
-                        results["baselines_uploaded"] += 1
-                        logger.info(f"Uploaded baseline for {doc['filename']}")
+                        s3_key, baseline_uploaded = future.result()
                     except Exception as e:
-                        logger.error(
-                            f"Failed to upload baseline for {doc['filename']}: {e}"
+                        filename = doc.get(
+                            "filename", os.path.basename(doc.get("path", "unknown"))
                         )
-                        # Continue processing document even if baseline fails
-
-                # Handle document upload/reference
-                # S3 upload automatically triggers EventBridge -> QueueSender -> SQS
-                s3_key = self._process_document_with_base(doc, batch_id, base_dir)
-
-                results["document_ids"].append(
-                    s3_key
-                )  # Use s3_key as document_id for tracking
-                results["queued"] += 1
+                        logger.error(f"Failed to process document {filename}: {e}")
+                        results["failed"] += 1
+                        continue
 
-                if doc["type"] == "local":
-                    results["uploaded"] += 1
+                    # Use s3_key as document_id for tracking
+                    results["document_ids"].append(s3_key)
+                    results["queued"] += 1
 
-            except Exception as e:
-                filename = doc.get(
-                    "filename", os.path.basename(doc.get("path", "unknown"))
-                )
-                logger.error(f"Failed to process document {filename}: {e}")
-                results["failed"] += 1
+                    if baseline_uploaded:
+                        results["baselines_uploaded"] += 1
+                    if doc["type"] == "local":
+                        results["uploaded"] += 1
 
         # Store batch metadata
         self._store_batch_metadata(batch_id, results)
@@ -264,6 +292,38 @@ class BatchProcessor:
         )
         return results
 
+    def _process_single_document(
+        self, doc: Dict, batch_id: str, base_dir: Optional[str] = None
+    ) -> Tuple[str, bool]:
+        """
+        Upload baseline (if any) and upload/reference a single document
+
+        Args:
+            doc: Document specification
+            batch_id: Batch identifier
+            base_dir: Base directory for path preservation (optional)
+
+        Returns:
+            Tuple of (S3 key for the document, whether a baseline was uploaded)
+        """
+        baseline_uploaded = False
+
+        # Upload baseline if specified
+        if doc.get("baseline_source"):
+            try:
+                self._upload_baseline(doc, batch_id, base_dir)
+                baseline_uploaded = True
+                logger.info(f"Uploaded baseline for {doc['filename']}")
+            except Exception as e:
+                logger.error(f"Failed to upload baseline for {doc['filename']}: {e}")
+                # Continue processing document even if baseline fails
+
+        # Handle document upload/reference
+        # S3 upload automatically triggers EventBridge -> QueueSender -> SQS
+        s3_key = self._process_document_with_base(doc, batch_id, base_dir)
+
+        return s3_key, baseline_uploaded
+
     def _scan_local_directory(
         self, dir_path: str, pattern: str, recursive: bool
     ) -> List[Dict]:
@@ -442,7 +502,14 @@ class BatchProcessor:
 
         # Upload file
         input_bucket = self.resources["InputBucket"]
-        self.s3.upload_file(Filename=local_path, Bucket=input_bucket, Key=s3_key)
+        # CRC32 lets S3 verify integrity without needing the awscrt extra
+        self.s3.upload_file(
+            Filename=local_path,
+            Bucket=input_bucket,
+            Key=s3_key,
+            ExtraArgs={"ChecksumAlgorithm": "CRC32"},
+            Config=DOCUMENT_TRANSFER_CONFIG,
+        )
 
         return s3_key
 
@@ -636,11 +703,13 @@ class BatchProcessor:
         output_bucket = self.resources["OutputBucket"]
         metadata_key = f"cli-batches/{batch_id}/metadata.json"
 
+        # Compact, gzip-encoded JSON keeps large document_id lists small
         self.s3.put_object(
             Bucket=output_bucket,
             Key=metadata_key,
-            Body=json.dumps(results, indent=2),
+            Body=gzip.compress(json.dumps(results).encode("utf-8")),
             ContentType="application/json",
+            ContentEncoding="gzip",
         )
 
         logger.debug(f"Stored batch metadata at s3://{output_bucket}/{metadata_key}")
@@ -660,7 +729,11 @@ class BatchProcessor:
 
         try:
             response = self.s3.get_object(Bucket=output_bucket, Key=metadata_key)
-            metadata = json.loads(response["Body"].read())
+            body = response["Body"].read()
+            # Batches stored before compression was introduced are plain JSON
+            if response.get("ContentEncoding") == "gzip":
+                body = gzip.decompress(body)
+            metadata = json.loads(body)
             return metadata
         except self.s3.exceptions.NoSuchKey:
             logger.warning(f"Batch metadata not found: {batch_id}")
@@ -683,25 +756,27 @@ class BatchProcessor:
         prefix = "cli-batches/"
 
         try:
-            response = self.s3.list_objects_v2(
+            # Page through all batch directories - a single call stops at 1000
+            paginator = self.s3.get_paginator("list_objects_v2")
+            pages = paginator.paginate(
                 Bucket=output_bucket, Prefix=prefix, Delimiter="/"
             )
-
-            # Get batch directories
-            batch_prefixes = [p["Prefix"] for p in response.get("CommonPrefixes", [])]
+            batch_prefixes = [
+                p["Prefix"] for page in pages for p in page.get("CommonPrefixes", [])
+            ]
 
             # Sort by name (which includes timestamp) - most recent first
             batch_prefixes = sorted(batch_prefixes, reverse=True)[:limit]
+            if not batch_prefixes:
+                return []
 
-            # Load metadata for each batch
-            batches = []
-            for batch_prefix in batch_prefixes:
-                batch_id = batch_prefix.rstrip("/").split("/")[-1]
-                batch_info = self.get_batch_info(batch_id)
-                if batch_info:
-                    batches.append(batch_info)
+            # Load metadata for each batch concurrently, keeping sort order
+            batch_ids = [p.rstrip("/").split("/")[-1] for p in batch_prefixes]
+            max_workers = min(MAX_METADATA_WORKERS, len(batch_ids))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                batches = list(executor.map(self.get_batch_info, batch_ids))
 
-            return batches
+            return [batch_info for batch_info in batches if batch_info]
 
         except Exception as e:
             logger.error(f"Error listing batches: {e}")
@@ -644,7 +644,7 @@ def rerun_inference(
 @click.option(
     "--manifest",
     type=click.Path(exists=True),
-    help="Path to manifest file (CSV or JSON)",
+    help="Path to manifest file (CSV, JSON or JSONL)",
 )
 @click.option(
     "--dir",
@@ -700,7 +700,7 @@ def run_inference(
     Run inference on a batch of documents
 
     Specify documents using ONE of:
-      --manifest: Explicit manifest file (CSV or JSON)
+      --manifest: Explicit manifest file (CSV, JSON or JSONL)
       --dir: Local directory (auto-generates manifest)
       --s3-uri: S3 URI (auto-generates manifest, any bucket)
 
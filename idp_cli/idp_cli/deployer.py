@@ -17,9 +17,47 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 import boto3
+from botocore.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Stack status polling: a few quick checks catch early validation failures,
+# then delays grow with decorrelated jitter up to the maximum
+FAST_POLL_CHECKS = 3
+FAST_POLL_DELAY_SECONDS = 2.0
+MIN_POLL_DELAY_SECONDS = 3.0
+MAX_POLL_DELAY_SECONDS = 30.0
+
+
+def _next_poll_delay(check_count: int, previous_delay: float) -> float:
+    """
+    Compute the delay before the next stack status check
+
+    Args:
+        check_count: Number of status checks made so far
+        previous_delay: Delay used before the last check
+
+    Returns:
+        Delay in seconds
+    """
+    if check_count < FAST_POLL_CHECKS:
+        return FAST_POLL_DELAY_SECONDS
+    return min(
+        MAX_POLL_DELAY_SECONDS,
+        random.uniform(
+            MIN_POLL_DELAY_SECONDS,
+            max(MIN_POLL_DELAY_SECONDS, previous_delay) * 3,
+        ),
+    )
+
+
+def _is_stack_not_found(error) -> bool:
+    """Check whether a CloudFormation ClientError reports a missing stack"""
+    error_info = error.response.get("Error", {})
+    if error_info.get("Code") != "ValidationError":
+        return False
+    return "does not exist" in error_info.get("Message", "")
+
 
 class StackDeployer:
     """Manages CloudFormation stack deployment"""
@@ -32,7 +70,12 @@ class StackDeployer:
             region: AWS region (optional)
         """
         self.region = region
-        self.cfn = boto3.client("cloudformation", region_name=region)
+        # Adaptive retries absorb DescribeStacks throttling during long waits
+        self.cfn = boto3.client(
+            "cloudformation",
+            region_name=region,
+            config=Config(retries={"mode": "adaptive", "max_attempts": 10}),
+        )
 
     def deploy_stack(
         self,
@@ -142,7 +185,7 @@ class StackDeployer:
             self.cfn.describe_stacks(StackName=stack_name)
             return True
         except self.cfn.exceptions.ClientError as e:
-            if "does not exist" in str(e):
+            if _is_stack_not_found(e):
                 return False
             raise
 
@@ -195,6 +238,8 @@ class StackDeployer:
                 f"[cyan]{operation} stack: {stack_name}", total=None
             )
             last_event_time = None
+            check_count = 0
+            delay = FAST_POLL_DELAY_SECONDS
 
             while True:
                 try:
@@ -238,7 +283,9 @@ class StackDeployer:
                         return result
 
                     # Wait before next check
-                    time.sleep(10)
+                    check_count += 1
+                    delay = _next_poll_delay(check_count, delay)
+                    time.sleep(delay)
 
                 except Exception as e:
                     logger.error(f"Error waiting for stack: {e}")
@@ -246,12 +293,10 @@ class StackDeployer:
 
     def _get_stack_outputs(self, stack: Dict) -> Dict[str, str]:
         """Extract stack outputs as dictionary"""
-        outputs = {}
-        for output in stack.get("Outputs", []):
-            key = output.get("OutputKey", "")
-            value = output.get("OutputValue", "")
-            outputs[key] = value
-        return outputs
+        return {
+            output["OutputKey"]: output["OutputValue"]
+            for output in stack.get("Outputs", [])
+        }
 
     def _get_stack_failure_reason(self, stack_name: str) -> str:
         """Get failure reason from stack events"""
@@ -433,6 +478,8 @@ class StackDeployer:
             console=console,
         ) as progress:
             task = progress.add_task(f"[cyan]DELETE stack: {stack_name}", total=None)
+            check_count = 0
+            delay = FAST_POLL_DELAY_SECONDS
 
             while True:
                 try:
@@ -464,10 +511,12 @@ class StackDeployer:
                         }
 
                     # Wait before next check
-                    time.sleep(10)
+                    check_count += 1
+                    delay = _next_poll_delay(check_count, delay)
+                    time.sleep(delay)
 
                 except self.cfn.exceptions.ClientError as e:
-                    if "does not exist" in str(e):
+                    if _is_stack_not_found(e):
                         # Stack deleted successfully
                         return {
                             "stack_name": stack_name,
@@ -4,28 +4,41 @@
 """
 Manifest Parser Module
 
-Parses CSV and JSON manifest files containing document batch information.
+Parses CSV, JSON and JSON Lines manifest files containing document batch information.
 """
 
 import csv
 import json
 import logging
 import os
+import sys
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Read buffer for streamed manifests; fewer read() calls on large files
+MANIFEST_READ_BUFFER_SIZE = 1024 * 1024
+
+# Manifest format for each supported file extension
+MANIFEST_FORMATS = {
+    ".csv": "csv",
+    ".txt": "csv",
+    ".json": "json",
+    ".jsonl": "jsonl",
+}
+
 
 class ManifestParser:
-    """Parses manifest files in CSV or JSON format"""
+    """Parses manifest files in CSV, JSON or JSON Lines format"""
 
     def __init__(self, manifest_path: str):
         """
         Initialize manifest parser
 
         Args:
-            manifest_path: Path to manifest file (CSV or JSON)
+            manifest_path: Path to manifest file (CSV, JSON or JSONL)
         """
         self.manifest_path = manifest_path
         self.format = self._detect_format()
@@ -34,12 +47,12 @@ class ManifestParser:
         """Detect manifest format from file extension"""
         ext = Path(self.manifest_path).suffix.lower()
 
-        if ext in [".csv", ".txt"]:
-            return "csv"
-        elif ext in [".json", ".jsonl"]:
-            return "json"
-        else:
-            raise ValueError(f"Unsupported manifest format: {ext}. Use .csv or .json")
+        manifest_format = MANIFEST_FORMATS.get(ext)
+        if manifest_format is None:
+            raise ValueError(
+                f"Unsupported manifest format: {ext}. Use .csv, .json or .jsonl"
+            )
+        return manifest_format
 
     def parse(self) -> List[Dict]:
         """
@@ -51,34 +64,45 @@ class ManifestParser:
                 - path: Local file path or S3 key
                 - type: 'local' or 's3-key'
         """
+        documents = list(self._iter_documents())
+        logger.info(f"Parsed {len(documents)} documents from {self.format.upper()}")
+        return documents
+
+    def _iter_documents(self) -> Iterator[Dict]:
+        """Yield normalized document dictionaries one at a time"""
         logger.info(f"Parsing {self.format.upper()} manifest: {self.manifest_path}")
 
         if self.format == "csv":
-            return self._parse_csv()
+            return self._iter_csv()
         elif self.format == "json":
-            return self._parse_json()
+            return self._iter_json()
+        elif self.format == "jsonl":
+            return self._iter_jsonl()
         else:
             raise ValueError(f"Unsupported format: {self.format}")
 
-    def _parse_csv(self) -> List[Dict]:
-        """Parse CSV manifest"""
-        documents = []
-
-        with open(self.manifest_path, "r", encoding="utf-8") as f:
+    def _iter_csv(self) -> Iterator[Dict]:
+        """Parse CSV manifest row by row"""
+        with open(
+            self.manifest_path,
+            "r",
+            encoding="utf-8",
+            newline="",
+            buffering=MANIFEST_READ_BUFFER_SIZE,
+        ) as f:
             reader = csv.DictReader(f)
+            # Intern header names so row lookups by literal field name hit on identity
+            if reader.fieldnames:
+                reader.fieldnames = [sys.intern(name) for name in reader.fieldnames]
 
             for row_num, row in enumerate(reader, start=2):  # Start at 2 (after header)
                 try:
-                    doc = self._validate_and_normalize_row(row, row_num)
-                    documents.append(doc)
+                    yield self._validate_and_normalize_row(row, row_num)
                 except ValueError as e:
                     logger.error(f"Row {row_num}: {e}")
                     raise
 
-        logger.info(f"Parsed {len(documents)} documents from CSV")
-        return documents
-
-    def _parse_json(self) -> List[Dict]:
+    def _iter_json(self) -> Iterator[Dict]:
         """Parse JSON manifest"""
         with open(self.manifest_path, "r", encoding="utf-8") as f:
             data = json.load(f)
@@ -93,17 +117,30 @@ class ManifestParser:
                 "JSON manifest must be an array or object with 'documents' key"
             )
 
-        documents = []
         for idx, doc in enumerate(documents_list, start=1):
             try:
-                validated_doc = self._validate_and_normalize_row(doc, idx)
-                documents.append(validated_doc)
+                yield self._validate_and_normalize_row(doc, idx)
             except ValueError as e:
                 logger.error(f"Document {idx}: {e}")
                 raise
 
-        logger.info(f"Parsed {len(documents)} documents from JSON")
-        return documents
+    def _iter_jsonl(self) -> Iterator[Dict]:
+        """Parse JSON Lines manifest line by line"""
+        with open(
+            self.manifest_path,
+            "r",
+            encoding="utf-8",
+            buffering=MANIFEST_READ_BUFFER_SIZE,
+        ) as f:
+            for line_num, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield self._validate_and_normalize_row(json.loads(line), line_num)
+                except ValueError as e:
+                    # json.JSONDecodeError is a ValueError subclass
+                    logger.error(f"Line {line_num}: {e}")
+                    raise
 
     def _validate_and_normalize_row(self, row: Dict, row_num: int) -> Dict:
         """
@@ -121,7 +158,7 @@ class ManifestParser:
                 - filename: Base filename
         """
         # Required field: document_path
-        document_path = row.get("document_path") or row.get("path", "").strip()
+        document_path = (row.get("document_path") or row.get("path") or "").strip()
 
         if not document_path:
             raise ValueError("Missing required field 'document_path' or 'path'")
@@ -133,19 +170,21 @@ class ManifestParser:
             if len(document_path) < 8 or "/" not in document_path[5:]:
                 raise ValueError(f"Invalid S3 URI format: {document_path}")
             filename = os.path.basename(document_path)
-        elif os.path.isabs(document_path) or os.path.exists(document_path):
+        else:
+            # Stat the path once for both type detection and existence check
+            path_exists = os.path.exists(document_path)
+            if not path_exists and not os.path.isabs(document_path):
+                raise ValueError(
+                    f"Invalid path '{document_path}'. Use absolute local path or s3:// URI"
+                )
             doc_type = "local"
             # Validate local file exists
-            if not os.path.exists(document_path):
+            if not path_exists:
                 raise ValueError(f"Local file not found: {document_path}")
             filename = os.path.basename(document_path)
-        else:
-            raise ValueError(
-                f"Invalid path '{document_path}'. Use absolute local path or s3:// URI"
-            )
 
         # Get baseline_source (optional)
-        baseline_source = row.get("baseline_source", "").strip() or None
+        baseline_source = (row.get("baseline_source") or "").strip() or None
 
         return {
             "path": document_path,
@@ -181,19 +220,17 @@ def validate_manifest(manifest_path: str) -> tuple[bool, Optional[str]]:
     """
     try:
         parser = ManifestParser(manifest_path)
-        documents = parser.parse()
 
-        if not documents:
+        # Stream documents, counting filenames to find duplicates (which would
+        # cause S3 key collisions)
+        filename_counts = Counter(doc["filename"] for doc in parser._iter_documents())
+
+        if not filename_counts:
             return False, "Manifest contains no documents"
 
-        # Check for duplicate filenames (which would cause S3 key collisions)
-        filenames = [doc["filename"] for doc in documents]
-        if len(filenames) != len(set(filenames)):
-            duplicates = [f for f in filenames if filenames.count(f) > 1]
-            return (
-                False,
-                f"Duplicate filenames found: {', '.join(set(duplicates))}.",
-            )
+        duplicates = [name for name, count in filename_counts.items() if count > 1]
+        if duplicates:
+            return False, f"Duplicate filenames found: {', '.join(duplicates)}."
 
         return True, None
 
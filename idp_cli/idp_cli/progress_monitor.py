@@ -9,12 +9,34 @@ Monitors batch processing progress by querying document status via LookupFunctio
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 import boto3
+from botocore.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Maximum per-document status lookups run concurrently when the batch query fails
+MAX_STATUS_WORKERS = 32
+
+# Documents per batched LookupFunction invocation; chunks are queried concurrently
+# so large batches stay within Lambda payload and timeout limits
+BATCH_QUERY_SIZE = 100
+
+# Summary bucket for each finished status; everything else is running or queued
+FINISHED_STATUS_BUCKETS = {"COMPLETED": "completed", "FAILED": "failed"}
+RUNNING_STATUSES = frozenset(
+    {
+        "RUNNING",
+        "CLASSIFYING",
+        "EXTRACTING",
+        "ASSESSING",
+        "SUMMARIZING",
+        "EVALUATING",
+    }
+)
+
 
 class ProgressMonitor:
     """Monitors document processing progress"""
@@ -31,7 +53,15 @@ class ProgressMonitor:
         self.stack_name = stack_name
         self.resources = resources
         self.region = region
-        self.lambda_client = boto3.client("lambda", region_name=region)
+        # Size the connection pool for concurrent per-document lookups
+        self.lambda_client = boto3.client(
+            "lambda",
+            region_name=region,
+            config=Config(
+                max_pool_connections=MAX_STATUS_WORKERS,
+                retries={"mode": "adaptive", "max_attempts": 5},
+            ),
+        )
         self.lookup_function = resources.get("LookupFunctionName", "")
 
         # Track finished documents to avoid redundant queries
@@ -82,32 +112,41 @@ class ProgressMonitor:
             f"Querying {len(docs_to_query)} active documents ({len(self.finished_docs)} cached)"
         )
 
-        # Batch query active documents
+        # Batch query active documents in chunks
         try:
-            statuses = self._batch_query_documents(docs_to_query)
+            chunks = [
+                docs_to_query[i : i + BATCH_QUERY_SIZE]
+                for i in range(0, len(docs_to_query), BATCH_QUERY_SIZE)
+            ]
+            max_workers = min(MAX_STATUS_WORKERS, len(chunks))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                statuses = [
+                    status
+                    for chunk_statuses in executor.map(
+                        self._batch_query_documents, chunks
+                    )
+                    for status in chunk_statuses
+                ]
 
             for status in statuses:
                 self._categorize_document(status, status_summary)
 
                 # Cache finished documents
-                if status["status"] in ["COMPLETED", "FAILED"]:
+                if status["status"] in FINISHED_STATUS_BUCKETS:
                     self.finished_docs[status["document_id"]] = status
 
         except Exception as e:
             logger.error(f"Error in batch query: {e}", exc_info=True)
-            # Fall back to individual queries if batch fails
-            for doc_id in docs_to_query:
-                try:
-                    status = self.get_document_status(doc_id)
+            # Fall back to individual queries if batch fails, run concurrently.
+            # get_document_status handles its own errors, so one failure does not
+            # cancel the other lookups.
+            max_workers = min(MAX_STATUS_WORKERS, len(docs_to_query))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for status in executor.map(self.get_document_status, docs_to_query):
                     self._categorize_document(status, status_summary)
 
-                    if status["status"] in ["COMPLETED", "FAILED"]:
+                    if status["status"] in FINISHED_STATUS_BUCKETS:
                         self.finished_docs[status["document_id"]] = status
-                except Exception as e:
-                    logger.error(f"Error getting status for {doc_id}: {e}")
-                    status_summary["queued"].append(
-                        {"document_id": doc_id, "status": "UNKNOWN", "error": str(e)}
-                    )
 
         # Check if all complete
         finished = len(status_summary["completed"]) + len(status_summary["failed"])
@@ -180,21 +219,10 @@ class ProgressMonitor:
         """
         status_value = status["status"]
 
-        if status_value == "COMPLETED":
-            status_summary["completed"].append(status)
-        elif status_value == "FAILED":
-            status_summary["failed"].append(status)
-        elif status_value in [
-            "RUNNING",
-            "CLASSIFYING",
-            "EXTRACTING",
-            "ASSESSING",
-            "SUMMARIZING",
-            "EVALUATING",
-        ]:
-            status_summary["running"].append(status)
-        else:
-            status_summary["queued"].append(status)
+        bucket = FINISHED_STATUS_BUCKETS.get(status_value)
+        if bucket is None:
+            bucket = "running" if status_value in RUNNING_STATUSES else "queued"
+        status_summary[bucket].append(status)
 
     def get_document_status(self, doc_id: str) -> Dict:
         """
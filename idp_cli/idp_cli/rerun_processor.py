@@ -67,6 +67,8 @@ class RerunProcessor:
         self.region = region
         self.lambda_client = boto3.client("lambda", region_name=region)
         self.sqs_client = boto3.client("sqs", region_name=region)
+        self.s3_client = boto3.client("s3", region_name=region)
+        self.cfn_client = boto3.client("cloudformation", region_name=region)
 
         # Import here to avoid circular dependency
         from .stack_info import StackInfo
@@ -89,8 +91,7 @@ class RerunProcessor:
     def _add_tracking_table(self):
         """Add TrackingTable to resources by querying CloudFormation"""
         try:
-            cfn = boto3.client("cloudformation", region_name=self.region)
-            response = cfn.describe_stack_resource(
+            response = self.cfn_client.describe_stack_resource(
                 StackName=self.stack_name, LogicalResourceId="TrackingTable"
             )
             physical_id = response["StackResourceDetail"]["PhysicalResourceId"]
@@ -102,8 +103,7 @@ class RerunProcessor:
     def _add_appsync_api(self):
         """Add AppSync API URL to resources by parsing CloudFormation outputs"""
         try:
-            cfn = boto3.client("cloudformation", region_name=self.region)
-            response = cfn.describe_stacks(StackName=self.stack_name)
+            response = self.cfn_client.describe_stacks(StackName=self.stack_name)
             stack = response["Stacks"][0]
 
             # AppSync URL is in WebUITestEnvFile output
@@ -271,7 +271,6 @@ class RerunProcessor:
         )
 
         # Delete section extraction data from S3 before clearing sections
-        s3_client = boto3.client("s3", region_name=self.region)
         for section in document.sections:
             if (
                 section.extraction_result_uri
@@ -284,7 +283,7 @@ class RerunProcessor:
                     )
                     if len(parts) == 2:
                         bucket, key = parts
-                        s3_client.delete_object(Bucket=bucket, Key=key)
+                        self.s3_client.delete_object(Bucket=bucket, Key=key)
                         logger.debug(
                             f"Deleted section extraction data: {section.extraction_result_uri}"
                         )
@@ -97,6 +97,42 @@ class TestBatchProcessor:
 
         # Note: S3 copy_object is called for S3 URIs (not head_object)
 
+    @patch("idp_cli.batch_processor.StackInfo")
+    @patch("boto3.client")
+    @patch("boto3.resource")
+    def test_process_documents_concurrently_preserves_order(
+        self, mock_resource, mock_client, mock_stack_info_class
+    ):
+        """Test concurrent processing keeps manifest order and counts failures"""
+        mock_stack_info = MagicMock()
+        mock_stack_info.validate_stack.return_value = True
+        mock_stack_info.get_resources.return_value = {
+            "InputBucket": "input-bucket",
+            "OutputBucket": "output-bucket",
+        }
+        mock_stack_info_class.return_value = mock_stack_info
+
+        mock_s3 = MagicMock()
+        mock_client.return_value = mock_s3
+
+        processor = BatchProcessor("test-stack")
+
+        documents = [
+            {"path": f"/tmp/doc{i}.pdf", "filename": f"doc{i}.pdf", "type": "local"}
+            for i in range(10)
+        ]
+        documents.insert(5, {"path": "bad.pdf", "filename": "bad.pdf", "type": "bad"})
+
+        result = processor._process_documents(
+            documents, "batch-123", "cli-batch", "test.csv"
+        )
+
+        assert result["document_ids"] == [f"batch-123/doc{i}.pdf" for i in range(10)]
+        assert result["queued"] == 10
+        assert result["uploaded"] == 10
+        assert result["failed"] == 1
+        assert mock_s3.upload_file.call_count == 10
+
     @patch("idp_cli.batch_processor.StackInfo")
     @patch("boto3.client")
     @patch("boto3.resource")
@@ -259,6 +295,39 @@ class TestBatchProcessor:
 
         assert retrieved == stored_metadata
 
+    @patch("idp_cli.batch_processor.StackInfo")
+    @patch("boto3.client")
+    @patch("boto3.resource")
+    def test_batch_metadata_gzip_round_trip(
+        self, mock_resource, mock_client, mock_stack_info_class
+    ):
+        """Test batch metadata is stored gzip-encoded and decoded on retrieval"""
+        mock_stack_info = MagicMock()
+        mock_stack_info.validate_stack.return_value = True
+        mock_stack_info.get_resources.return_value = {
+            "InputBucket": "input-bucket",
+            "OutputBucket": "output-bucket",
+        }
+        mock_stack_info_class.return_value = mock_stack_info
+
+        mock_s3 = MagicMock()
+        mock_client.return_value = mock_s3
+
+        processor = BatchProcessor("test-stack")
+
+        stored_metadata = {"batch_id": "test-batch-123", "document_ids": ["doc1"]}
+        processor._store_batch_metadata("test-batch-123", stored_metadata)
+
+        put_kwargs = mock_s3.put_object.call_args[1]
+        assert put_kwargs["ContentEncoding"] == "gzip"
+
+        mock_s3.get_object.return_value = {
+            "Body": MagicMock(read=lambda: put_kwargs["Body"]),
+            "ContentEncoding": "gzip",
+        }
+
+        assert processor.get_batch_info("test-batch-123") == stored_metadata
+
     @patch("idp_cli.batch_processor.StackInfo")
     @patch("boto3.client")
     @patch("boto3.resource")
@@ -284,3 +353,44 @@ class TestBatchProcessor:
         result = processor.get_batch_info("nonexistent-batch")
 
         assert result is None
+
+    @patch("idp_cli.batch_processor.StackInfo")
+    @patch("boto3.client")
+    @patch("boto3.resource")
+    def test_list_batches_paginates_and_sorts(
+        self, mock_resource, mock_client, mock_stack_info_class
+    ):
+        """Test listing batches across pages returns most recent first"""
+        mock_stack_info = MagicMock()
+        mock_stack_info.validate_stack.return_value = True
+        mock_stack_info.get_resources.return_value = {
+            "InputBucket": "input-bucket",
+            "OutputBucket": "output-bucket",
+        }
+        mock_stack_info_class.return_value = mock_stack_info
+
+        mock_s3 = MagicMock()
+        mock_s3.get_paginator.return_value.paginate.return_value = [
+            {"CommonPrefixes": [{"Prefix": "cli-batches/batch-20250101-000000/"}]},
+            {
+                "CommonPrefixes": [
+                    {"Prefix": "cli-batches/batch-20250103-000000/"},
+                    {"Prefix": "cli-batches/batch-20250102-000000/"},
+                ]
+            },
+        ]
+        mock_client.return_value = mock_s3
+
+        processor = BatchProcessor("test-stack")
+
+        with patch.object(
+            processor,
+            "get_batch_info",
+            side_effect=lambda batch_id: {"batch_id": batch_id},
+        ):
+            batches = processor.list_batches(limit=2)
+
+        assert [b["batch_id"] for b in batches] == [
+            "batch-20250103-000000",
+            "batch-20250102-000000",
+        ]
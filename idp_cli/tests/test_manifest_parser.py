@@ -12,6 +12,19 @@ import pytest
 from idp_cli.manifest_parser import ManifestParser, parse_manifest, validate_manifest
 
 
+@pytest.fixture(scope="module")
+def single_s3_csv_manifest(tmp_path_factory):
+    """CSV manifest with a single S3 document, written once and shared read-only"""
+    manifest_file = tmp_path_factory.mktemp("manifests") / "single.csv"
+
+    with open(manifest_file, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["document_path"])
+        writer.writerow(["s3://bucket/doc1.pdf"])
+
+    return str(manifest_file)
+
+
 class TestManifestParser:
     """Test manifest parsing functionality"""
 
@@ -84,32 +97,42 @@ class TestManifestParser:
         assert len(documents) == 2
         assert documents[0]["type"] == "s3"
 
-    def test_missing_document_path(self, tmp_path):
-        """Test error handling for missing document path"""
-        manifest_file = tmp_path / "test.csv"
+    def test_jsonl_parsing(self, tmp_path):
+        """Test JSON Lines parsing with one document per line"""
+        manifest_file = tmp_path / "test.jsonl"
 
-        with open(manifest_file, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["baseline_source"])
-            writer.writerow(["doc1"])
+        lines = [
+            {"document_path": "s3://bucket/doc1.pdf"},
+            {"document_path": "s3://bucket/doc2.pdf", "baseline_source": "doc2"},
+        ]
+        manifest_file.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n")
 
         parser = ManifestParser(str(manifest_file))
+        documents = parser.parse()
 
-        with pytest.raises(ValueError, match="Missing required field"):
-            parser.parse()
-
-    def test_local_file_not_found(self, tmp_path):
-        """Test error handling for missing local file"""
+        assert len(documents) == 2
+        assert documents[1]["filename"] == "doc2.pdf"
+        assert documents[1]["baseline_source"] == "doc2"
+
+    @pytest.mark.parametrize(
+        "rows,match",
+        [
+            ([["baseline_source"], ["doc1"]], "Missing required field"),
+            ([["document_path"], ["/nonexistent/file.pdf"]], "Local file not found"),
+            ([["document_path"], ["relative/missing.pdf"]], "Invalid path"),
+            ([["document_path"], ["s3://bucket"]], "Invalid S3 URI format"),
+        ],
+    )
+    def test_invalid_csv_rows(self, tmp_path, rows, match):
+        """Test error handling for invalid CSV manifest rows"""
         manifest_file = tmp_path / "test.csv"
 
         with open(manifest_file, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["document_path"])
-            writer.writerow(["/nonexistent/file.pdf"])
+            csv.writer(f).writerows(rows)
 
         parser = ManifestParser(str(manifest_file))
 
-        with pytest.raises(ValueError, match="Local file not found"):
+        with pytest.raises(ValueError, match=match):
             parser.parse()
 
     def test_s3_uri_support(self, tmp_path):
@@ -128,16 +151,9 @@ class TestManifestParser:
         assert documents[0]["type"] == "s3"
         assert documents[0]["path"] == "s3://bucket/key.pdf"
 
-    def test_validate_manifest_success(self, tmp_path):
+    def test_validate_manifest_success(self, single_s3_csv_manifest):
         """Test manifest validation success"""
-        manifest_file = tmp_path / "test.csv"
-
-        with open(manifest_file, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["document_path"])
-            writer.writerow(["s3://bucket/doc1.pdf"])
-
-        is_valid, error = validate_manifest(str(manifest_file))
+        is_valid, error = validate_manifest(single_s3_csv_manifest)
 
         assert is_valid
         assert error is None
@@ -193,15 +209,26 @@ class TestManifestParser:
 
         assert documents[0]["baseline_source"] == "s3://baselines/doc1/"
 
-    def test_parse_manifest_convenience_function(self, tmp_path):
-        """Test convenience parse_manifest function"""
-        manifest_file = tmp_path / "test.csv"
+    def test_fields_are_stripped(self, tmp_path):
+        """Test document_path and missing/null optional fields are normalized"""
+        manifest_file = tmp_path / "test.json"
 
-        with open(manifest_file, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["document_path"])
-            writer.writerow(["s3://bucket/doc1.pdf"])
+        data = [
+            {"document_path": "  s3://bucket/doc1.pdf  "},
+            {"path": "s3://bucket/doc2.pdf", "baseline_source": None},
+        ]
 
-        documents = parse_manifest(str(manifest_file))
+        with open(manifest_file, "w") as f:
+            json.dump(data, f)
+
+        parser = ManifestParser(str(manifest_file))
+        documents = parser.parse()
+
+        assert documents[0]["path"] == "s3://bucket/doc1.pdf"
+        assert documents[1]["baseline_source"] is None
+
+    def test_parse_manifest_convenience_function(self, single_s3_csv_manifest):
+        """Test convenience parse_manifest function"""
+        documents = parse_manifest(single_s3_csv_manifest)
 
         assert len(documents) == 1
@@ -9,7 +9,7 @@ import json
 from unittest.mock import MagicMock, patch
 
 import pytest
-from idp_cli.progress_monitor import ProgressMonitor
+from idp_cli.progress_monitor import BATCH_QUERY_SIZE, ProgressMonitor
 
 
 class TestProgressMonitor:
@@ -189,6 +189,37 @@ class TestProgressMonitor:
         assert len(status_data["completed"]) == 2
         assert status_data["all_complete"] is True
 
+    @patch("boto3.client")
+    def test_get_batch_status_chunks_batch_queries(self, mock_boto_client):
+        """Test large batches are queried in chunks of BATCH_QUERY_SIZE"""
+        mock_lambda = MagicMock()
+        mock_boto_client.return_value = mock_lambda
+
+        def mock_invoke(FunctionName, InvocationType, Payload):
+            object_keys = json.loads(Payload)["object_keys"]
+            results = [
+                {"object_key": key, "status": "COMPLETED"} for key in object_keys
+            ]
+            return {
+                "Payload": MagicMock(
+                    read=lambda: json.dumps({"results": results}).encode()
+                )
+            }
+
+        mock_lambda.invoke.side_effect = mock_invoke
+
+        resources = {"LookupFunctionName": "test-function"}
+        monitor = ProgressMonitor("test-stack", resources)
+
+        document_ids = [f"doc{i}" for i in range(BATCH_QUERY_SIZE * 2 + 1)]
+        status_data = monitor.get_batch_status(document_ids)
+
+        assert mock_lambda.invoke.call_count == 3
+        assert [doc["document_id"] for doc in status_data["completed"]] == (
+            document_ids
+        )
+        assert status_data["all_complete"] is True
+
     @patch("boto3.client")
     def test_calculate_statistics(self, mock_boto_client):
         """Test statistics calculation"""
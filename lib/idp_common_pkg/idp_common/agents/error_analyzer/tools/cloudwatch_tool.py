@@ -8,8 +8,9 @@ CloudWatch tools for error analysis.
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import boto3
 from strands import tool
@@ -19,6 +20,42 @@ from .lambda_tool import lambda_document_context
 
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent log group searches (bounded to stay below API throttling limits)
+MAX_SEARCH_WORKERS = 5
+
+# Filter terms that CloudWatch accepts without double quotes
+_PLAIN_FILTER_TERM = re.compile(r"\w+")
+
+# A pattern made only of "?term" alternatives, as built by
+# build_any_term_filter_pattern (terms may be double-quoted)
+_ANY_TERM = r'\?(?:"(?:[^"\\]|\\.)*"|\S+)'
+_ANY_TERM_FILTER_PATTERN = re.compile(rf"{_ANY_TERM}(?:\s+{_ANY_TERM})*")
+
+# Error search patterns: results skip INFO and Lambda system lines, so extra
+# events are fetched to make up for the ones dropped
+_ERROR_FILTER_PATTERNS = frozenset(
+    ["[ERROR]", "[WARN]", "ERROR:", "WARN:", "Exception", "Failed"]
+)
+
+_logs_client = None
+_cloudformation_client = None
+
+
+def _get_logs_client():
+    """Returns a shared CloudWatch Logs client (boto3 clients are thread-safe)."""
+    global _logs_client
+    if _logs_client is None:
+        _logs_client = boto3.client("logs")
+    return _logs_client
+
+
+def _get_cloudformation_client():
+    """Returns a shared CloudFormation client, created on first use."""
+    global _cloudformation_client
+    if _cloudformation_client is None:
+        _cloudformation_client = boto3.client("cloudformation")
+    return _cloudformation_client
+
 
 def search_cloudwatch_logs(
     log_group_name: str,
@@ -49,7 +86,7 @@ def search_cloudwatch_logs(
         logger.debug(
             f"Searching CloudWatch logs in {log_group_name} with filter '{filter_pattern}'"
         )
-        client = boto3.client("logs")
+        client = _get_logs_client()
 
         # Use provided time window or default to hours_back from now
         if start_time and end_time:
@@ -62,8 +99,7 @@ def search_cloudwatch_logs(
         # Use higher limit for error patterns to account for INFO log filtering
         search_limit = (
             int(max_events) * 5
-            if filter_pattern
-            in ["[ERROR]", "[WARN]", "ERROR:", "WARN:", "Exception", "Failed"]
+            if _is_error_filter_pattern(filter_pattern)
             else int(max_events)
         )
 
@@ -152,6 +188,48 @@ def _build_filter_pattern(base_pattern: str, request_id: str = None) -> str:
         return ""
 
 
+def build_any_term_filter_pattern(terms: Iterable[str]) -> str:
+    """
+    Build a CloudWatch filter pattern matching events that contain any of the terms.
+    Lets several error patterns be searched with a single filter_log_events call
+    instead of one call per pattern. Searches using the result are treated as
+    error searches (INFO and Lambda system lines excluded, extra events fetched).
+
+    Args:
+        terms: Terms to match (e.g., ["ERROR", "Exception"])
+
+    Returns:
+        Filter pattern string using the CloudWatch "?term" OR syntax. Terms with
+        characters other than letters, digits and underscores are double-quoted.
+    """
+    return " ".join(f"?{_quote_filter_term(term)}" for term in terms if term)
+
+
+def _is_error_filter_pattern(filter_pattern: str) -> bool:
+    """
+    Check whether a filter pattern searches for errors.
+    Combined "?term" patterns from build_any_term_filter_pattern count as error
+    searches, matching how their individual terms were searched before.
+
+    Args:
+        filter_pattern: CloudWatch filter pattern being used
+
+    Returns:
+        True if INFO/system log exclusion and over-fetching apply
+    """
+    if filter_pattern in _ERROR_FILTER_PATTERNS:
+        return True
+    return bool(_ANY_TERM_FILTER_PATTERN.fullmatch(filter_pattern))
+
+
+def _quote_filter_term(term: str) -> str:
+    """Double-quote a filter term unless it is a plain alphanumeric word."""
+    if _PLAIN_FILTER_TERM.fullmatch(term):
+        return term
+    escaped = term.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
 def get_cloudwatch_log_groups(prefix: str = "") -> Dict[str, Any]:
     """
     Lists CloudWatch log groups matching specified prefix.
@@ -172,7 +250,7 @@ def get_cloudwatch_log_groups(prefix: str = "") -> Dict[str, Any]:
                 "warning": "Empty prefix provided",
             }
 
-        client = boto3.client("logs")
+        client = _get_logs_client()
         response = client.describe_log_groups(logGroupNamePrefix=prefix)
 
         groups = []
@@ -236,7 +314,7 @@ def extract_request_ids_from_logs(
     function_request_map = {}
     all_request_ids = []
 
-    client = boto3.client("logs")
+    client = _get_logs_client()
     logger.info(
         f"Extracting request IDs from {len(log_groups)} log groups using execution ID: {execution_id}"
     )
@@ -279,7 +357,7 @@ def extract_request_ids_from_logs(
     )
     return {
         "function_request_map": function_request_map,
-        "all_request_ids": list(set(all_request_ids)),
+        "all_request_ids": all_request_ids,
         "extraction_method": "cloudwatch_logs",
         "extraction_success": len(all_request_ids) > 0,
     }
@@ -350,7 +428,7 @@ def get_log_group_prefix(stack_name: str) -> Dict[str, Any]:
         Dict containing prefix information and metadata
     """
     try:
-        cf_client = boto3.client("cloudformation")
+        cf_client = _get_cloudformation_client()
         stack_response = cf_client.describe_stacks(StackName=stack_name)
         stacks = stack_response.get("Stacks", [])
 
@@ -868,23 +946,34 @@ def cloudwatch_stack_logs(
                 "message": "No log groups found with the determined prefix",
             }
 
-        # Search each log group
+        # Search log groups concurrently - each search is a network-bound API call
         groups_to_search = log_groups["log_groups"][:max_log_groups]
         all_results = []
         total_events = 0
 
-        for group in groups_to_search:
-            log_group_name = group["name"]
-
-            search_result = search_cloudwatch_logs(
-                log_group_name=log_group_name,
-                filter_pattern=filter_pattern,
-                hours_back=hours_back,
-                max_events=max_log_events,
-                start_time=start_time,
-                end_time=end_time,
+        # Create the shared client up front - client creation is not thread-safe
+        _get_logs_client()
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_SEARCH_WORKERS, len(groups_to_search)))
+        ) as executor:
+            search_results = list(
+                executor.map(
+                    lambda group: search_cloudwatch_logs(
+                        log_group_name=group["name"],
+                        filter_pattern=filter_pattern,
+                        hours_back=hours_back,
+                        max_events=max_log_events,
+                        start_time=start_time,
+                        end_time=end_time,
+                    ),
+                    groups_to_search,
+                )
             )
 
+        # Assemble results in log group order
+        for group, search_result in zip(groups_to_search, search_results):
+            log_group_name = group["name"]
+
             if search_result.get("events_found", 0) > 0:
                 logger.info(
                     f"Found {search_result['events_found']} events in {log_group_name}"
@@ -932,14 +1021,7 @@ def _should_exclude_log_event(message: str, filter_pattern: str = "") -> bool:
         True if message should be excluded from LLM context
     """
     # Skip INFO logs when searching for error patterns
-    if filter_pattern in [
-        "[ERROR]",
-        "[WARN]",
-        "ERROR:",
-        "WARN:",
-        "Exception",
-        "Failed",
-    ]:
+    if _is_error_filter_pattern(filter_pattern):
         if message.strip().startswith("[INFO]"):
             return True
         # Skip Lambda system logs
@@ -7,8 +7,10 @@ DynamoDB tools for error analysis.
 
 import logging
 import os
+import random
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 from strands import tool
@@ -17,6 +19,182 @@ from ..config import create_error_response, create_response, decimal_to_float
 
 logger = logging.getLogger(__name__)
 
+# Maximum follow-up pages read across all list partitions in one query; the
+# first page of each hour partition is always read
+MAX_QUERY_PAGES = 10
+
+# Maximum keys accepted by a single BatchGetItem request
+BATCH_GET_MAX_KEYS = 100
+
+# BatchGetItem attempts per key chunk while DynamoDB returns UnprocessedKeys
+BATCH_GET_MAX_ATTEMPTS = 5
+
+
+# Status index lookups by table name; failed lookups are not cached so they are
+# retried on the next query
+_status_index_cache: Dict[str, Optional[Tuple[str, Optional[str]]]] = {}
+
+
+def _find_status_index(table_name: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Find a global secondary index keyed on ObjectStatus, probing the table once.
+
+    Args:
+        table_name: DynamoDB table name
+
+    Returns:
+        Tuple of (index_name, range_key_name) or None if no such index exists
+        or the table could not be described
+    """
+    if table_name in _status_index_cache:
+        return _status_index_cache[table_name]
+
+    try:
+        table = boto3.client("dynamodb").describe_table(TableName=table_name)["Table"]
+    except Exception as e:
+        logger.debug(f"Could not describe table {table_name}: {e}")
+        return None
+
+    status_index = None
+    for index in table.get("GlobalSecondaryIndexes", []):
+        keys = {k["KeyType"]: k["AttributeName"] for k in index.get("KeySchema", [])}
+        if keys.get("HASH") == "ObjectStatus":
+            status_index = index["IndexName"], keys.get("RANGE")
+            break
+
+    _status_index_cache[table_name] = status_index
+    return status_index
+
+
+def _get_documents_with_status(
+    dynamodb, table_name: str, list_items: List[Dict], status: str
+) -> List[Dict]:
+    """
+    Resolve list partition items to their document records and keep those with a status.
+
+    List items only carry ObjectKey and QueuedTime, so the status has to be read
+    from the matching doc# item.
+
+    Args:
+        dynamodb: boto3 DynamoDB resource
+        table_name: DynamoDB table name
+        list_items: Items read from list# partitions
+        status: ObjectStatus value to keep
+
+    Returns:
+        Document records with a matching ObjectStatus, in list item order. Keys
+        still unprocessed after BATCH_GET_MAX_ATTEMPTS are logged and skipped.
+    """
+    object_keys = list(
+        dict.fromkeys(item["ObjectKey"] for item in list_items if "ObjectKey" in item)
+    )
+    documents = {}
+    for i in range(0, len(object_keys), BATCH_GET_MAX_KEYS):
+        request_items = {
+            table_name: {
+                "Keys": [
+                    {"PK": f"doc#{key}", "SK": "none"}
+                    for key in object_keys[i : i + BATCH_GET_MAX_KEYS]
+                ]
+            }
+        }
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                # Unprocessed keys mean the table is throttling - back off with jitter
+                time.sleep(min(0.05 * 2**attempt, 1) * random.random())
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            for document in response.get("Responses", {}).get(table_name, []):
+                documents[document.get("ObjectKey")] = document
+            request_items = response.get("UnprocessedKeys")
+            if not request_items:
+                break
+        else:
+            unprocessed = request_items.get(table_name, {}).get("Keys", [])
+            logger.warning(
+                f"Skipping {len(unprocessed)} document records still unprocessed "
+                f"after {BATCH_GET_MAX_ATTEMPTS} attempts: {unprocessed}"
+            )
+
+    return [
+        documents[key]
+        for key in object_keys
+        if documents.get(key, {}).get("ObjectStatus") == status
+    ]
+
+
+def _query_list_partitions(
+    dynamodb,
+    table_name: str,
+    start_time: datetime,
+    end_time: datetime,
+    limit: int,
+    status: str = "",
+) -> List[Dict]:
+    """
+    Collect tracking items from the hourly list# partitions in a time window.
+
+    Args:
+        dynamodb: boto3 DynamoDB resource
+        table_name: DynamoDB table name
+        start_time: Start of the time window
+        end_time: End of the time window
+        limit: Maximum number of items to collect
+        status: Optional ObjectStatus value; matching document records are returned
+
+    Returns:
+        List items, or document records when filtering on status
+    """
+    table = dynamodb.Table(table_name)
+    all_items = []
+    extra_pages = MAX_QUERY_PAGES
+
+    # Query by hour partitions for efficiency
+    current_time = start_time
+    while current_time < end_time and len(all_items) < limit:
+        hour_str = current_time.strftime("%Y-%m-%dT%H")
+
+        # Query the list partition for this hour
+        pk = f"list#{current_time.strftime('%Y-%m-%d')}#s#{current_time.hour // 4:02d}"
+        sk_prefix = f"ts#{hour_str}"
+
+        try:
+            query_params = {
+                "KeyConditionExpression": "PK = :pk AND begins_with(SK, :sk_prefix)",
+                "ExpressionAttributeValues": {
+                    ":pk": pk,
+                    ":sk_prefix": sk_prefix,
+                },
+                # Status is checked on the document records afterwards,
+                # so read full pages when filtering
+                "Limit": 50 if status else min(limit - len(all_items), 50),
+            }
+
+            # Page until enough matches are collected, the partition is
+            # exhausted or the shared page budget is spent
+            while True:
+                response = table.query(**query_params)
+                page_items = response.get("Items", [])
+                if status:
+                    page_items = _get_documents_with_status(
+                        dynamodb, table_name, page_items, status
+                    )
+                all_items.extend(page_items)
+                if (
+                    len(all_items) >= limit
+                    or "LastEvaluatedKey" not in response
+                    or extra_pages <= 0
+                ):
+                    break
+                extra_pages -= 1
+                query_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        except Exception as query_error:
+            logger.debug(f"Query failed for {pk}: {query_error}")
+
+        current_time += timedelta(hours=1)
+
+    return all_items[:limit]
+
 
 @tool
 def dynamodb_document_status(object_key: str) -> Dict[str, Any]:
@@ -79,7 +257,7 @@ def dynamodb_table_name() -> Dict[str, Any]:
 
 @tool
 def dynamodb_tracking_query(
-    date: str = "", hours_back: int = 24, limit: int = 100
+    date: str = "", hours_back: int = 24, limit: int = 100, status: str = ""
 ) -> Dict[str, Any]:
     """
     Query DynamoDB tracking table using efficient time-based partition scanning.
@@ -90,6 +268,8 @@ def dynamodb_tracking_query(
         date: Date in YYYY-MM-DD format (defaults to today)
         hours_back: Number of hours to look back from date (default 24)
         limit: Maximum number of items to return
+        status: Optional ObjectStatus value to filter on (e.g., "FAILED"); when set,
+            the matching document records are returned
 
     Returns:
         Dict containing found items and query metadata
@@ -116,30 +296,34 @@ def dynamodb_tracking_query(
         start_time = end_time - timedelta(hours=hours_back)
 
         all_items = []
-        current_time = start_time
-
-        # Query by hour partitions for efficiency
-        while current_time < end_time and len(all_items) < limit:
-            hour_str = current_time.strftime("%Y-%m-%dT%H")
-
-            # Query the list partition for this hour
-            pk = f"list#{current_time.strftime('%Y-%m-%d')}#s#{current_time.hour // 4:02d}"
-            sk_prefix = f"ts#{hour_str}"
 
-            try:
-                response = table.query(
-                    KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
-                    ExpressionAttributeValues={":pk": pk, ":sk_prefix": sk_prefix},
-                    Limit=min(limit - len(all_items), 50),
+        # Prefer a status index when available - reads only matching items
+        status_index = _find_status_index(table_name) if status else None
+        if status_index:
+            index_name, range_key = status_index
+            query_params = {
+                "IndexName": index_name,
+                "KeyConditionExpression": "ObjectStatus = :status",
+                "ExpressionAttributeValues": {":status": status},
+            }
+            if range_key == "CompletionTime":
+                query_params["KeyConditionExpression"] += (
+                    " AND CompletionTime BETWEEN :start AND :end"
+                )
+                query_params["ExpressionAttributeValues"].update(
+                    {":start": start_time.isoformat(), ":end": end_time.isoformat()}
                 )
 
-                items = response.get("Items", [])
-                all_items.extend(items)
-
-            except Exception as query_error:
-                logger.debug(f"Query failed for {pk}: {query_error}")
-
-            current_time += timedelta(hours=1)
+            while len(all_items) < limit:
+                response = table.query(Limit=limit - len(all_items), **query_params)
+                all_items.extend(response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    break
+                query_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        else:
+            all_items = _query_list_partitions(
+                dynamodb, table_name, start_time, end_time, limit, status
+            )
 
         items = [decimal_to_float(item) for item in all_items[:limit]]
 
@@ -6,6 +6,7 @@ System-wide analysis tool.
 """
 
 import logging
+import re
 from typing import Any, Dict, List
 
 from strands import tool
@@ -17,127 +18,153 @@ from ..config import (
     safe_int_conversion,
     truncate_message,
 )
-from .cloudwatch_tool import cloudwatch_stack_logs
+from .cloudwatch_tool import build_any_term_filter_pattern, cloudwatch_stack_logs
 from .dynamodb_tool import dynamodb_table_name, dynamodb_tracking_query
 from .stepfunction_tool import stepfunction_execution_details
 from .xray_tool import xray_service_map, xray_stack_traces
 
 logger = logging.getLogger(__name__)
 
+# Prioritized CloudWatch error patterns with the max sample events for each
+_ERROR_PATTERNS = (
+    ("ERROR", 5),
+    ("Exception", 3),
+    ("ValidationException", 2),
+    ("Failed", 2),
+    ("Timeout", 1),
+)
+# CloudWatch filter matching any of the error patterns, built once at import
+_ERROR_FILTER_PATTERN = build_any_term_filter_pattern(p for p, _ in _ERROR_PATTERNS)
+
+# Single case-insensitive scan for all category keywords
+_CATEGORY_PATTERN = re.compile(
+    r"(?P<validation_errors>validation|invalid)"
+    r"|(?P<timeout_errors>timeout)"
+    r"|(?P<access_errors>access|denied)"
+    r"|(?P<processing_errors>exception|error)",
+    re.IGNORECASE,
+)
+# Category precedence when a message matches several keywords
+_CATEGORY_PRIORITY = (
+    "validation_errors",
+    "timeout_errors",
+    "access_errors",
+    "processing_errors",
+)
+
 
 def _get_failed_documents(time_range_hours: int) -> List[Dict]:
     """Query DynamoDB tracking table for documents with FAILED status."""
-    error_records = dynamodb_tracking_query(hours_back=time_range_hours, limit=50)
-    failed_docs = []
-
-    for item in error_records.get("items", []):
-        status = item.get("Status") or item.get("ObjectStatus")
-        if status == "FAILED":
-            failed_docs.append(
-                {
-                    "document_id": item.get("ObjectKey"),
-                    "status": status,
-                    "completion_time": item.get("CompletionTime"),
-                    "error_message": item.get("ErrorMessage"),
-                }
-            )
-
-    return failed_docs
+    error_records = dynamodb_tracking_query(
+        hours_back=time_range_hours, limit=50, status="FAILED"
+    )
+
+    return [
+        {
+            "document_id": item.get("ObjectKey"),
+            "status": item.get("ObjectStatus"),
+            "completion_time": item.get("CompletionTime"),
+            "error_message": item.get("ErrorMessage"),
+        }
+        for item in error_records.get("items", [])
+    ]
 
 
 def _collect_log_events(
     time_range_hours: int, max_log_events: int, config: Dict
-) -> tuple[Dict, List, int]:
-    """Search CloudWatch logs using prioritized error patterns and collect events."""
-    patterns = [
-        ("ERROR", 5),
-        ("Exception", 3),
-        ("ValidationException", 2),
-        ("Failed", 2),
-        ("Timeout", 1),
-    ]
-
+) -> tuple[Dict, Dict[str, List[Dict]], int]:
+    """Search CloudWatch logs using prioritized error patterns and collect categorized events."""
     error_summary = {}
-    all_events = []
+    categories = {
+        "validation_errors": [],
+        "processing_errors": [],
+        "system_errors": [],
+        "timeout_errors": [],
+        "access_errors": [],
+    }
     total_collected = 0
 
-    for pattern, max_events in patterns:
+    # Search all patterns with a single OR filter, then partition by pattern.
+    # Each log group gets enough events to fill every pattern's sample budget.
+    results = cloudwatch_stack_logs(
+        filter_pattern=_ERROR_FILTER_PATTERN,
+        hours_back=time_range_hours,
+        max_log_events=sum(min(m, max_log_events) for _, m in _ERROR_PATTERNS),
+        max_log_groups=10,
+    )
+
+    # An event counts toward every pattern it matches, so specific patterns
+    # (e.g. ValidationException) are not swallowed by broader ones (Exception)
+    events_by_pattern = {pattern: [] for pattern, _ in _ERROR_PATTERNS}
+    for result in results.get("results", []):
+        for event in result.get("events", []):
+            message = event.get("message", "")
+            for pattern, _ in _ERROR_PATTERNS:
+                if pattern in message:
+                    events_by_pattern[pattern].append(event)
+
+    for pattern, max_events in _ERROR_PATTERNS:
         if total_collected >= max_log_events:
             break
 
-        results = cloudwatch_stack_logs(
-            filter_pattern=pattern,
-            hours_back=time_range_hours,
-            max_log_events=min(max_events, max_log_events - total_collected),
-            max_log_groups=10,
-        )
-
-        if results.get("total_events_found", 0) > 0:
-            pattern_events = []
-            for result in results.get("results", []):
-                pattern_events.extend(result.get("events", []))
-
-            filtered_events = _filter_events(pattern_events, config)
+        pattern_events = events_by_pattern[pattern]
+        if pattern_events:
+            filtered_events = _filter_events(
+                pattern_events,
+                config,
+                categories,
+                max_events=min(max_events, max_log_events - total_collected),
+            )
             error_summary[pattern] = {
-                "count": results.get("total_events_found", 0),
+                "count": len(pattern_events),
                 "sample_events": filtered_events,
             }
-            all_events.extend(filtered_events)
             total_collected += len(filtered_events)
 
-    return error_summary, all_events, total_collected
-
+    return error_summary, categories, total_collected
 
-def _filter_events(events: List[Dict], config: Dict) -> List[Dict]:
-    """Remove duplicate events and truncate messages to reduce context size."""
-    import re
 
+def _filter_events(
+    events: List[Dict],
+    config: Dict,
+    categories: Dict[str, List[Dict]],
+    max_events: int = 10,
+) -> List[Dict]:
+    """Remove duplicate events, truncate messages and categorize them in a single pass."""
     max_length = config.get("max_log_message_length", 200)
     seen = set()
     filtered = []
+    if max_events <= 0:
+        return filtered
 
     for event in events:
         message = event.get("message", "")
         signature = re.sub(r"\d{4}-\d{2}-\d{2}.*?Z", "", message)
         signature = re.sub(r"RequestId: [a-f0-9-]+", "", signature)
+        # Track signature hashes rather than full (possibly long) messages
+        signature_key = hash(signature)
+
+        if signature_key not in seen:
+            seen.add(signature_key)
+            filtered_event = {
+                "timestamp": event["timestamp"],
+                "message": truncate_message(message, max_length),
+                "log_stream": event.get("log_stream", "")[:50],
+            }
+            filtered.append(filtered_event)
+            categories[_categorize_message(message)].append(filtered_event)
 
-        if signature not in seen and len(filtered) < 10:
-            seen.add(signature)
-            filtered.append(
-                {
-                    "timestamp": event["timestamp"],
-                    "message": truncate_message(message, max_length),
-                    "log_stream": event.get("log_stream", "")[:50],
-                }
-            )
+            # Skip signature work for the remaining events once the cap is hit
+            if len(filtered) >= max_events:
+                break
 
     return filtered
 
 
-def _categorize_errors(events: List[Dict]) -> Dict[str, List[Dict]]:
-    """Group log events into categories based on message content patterns."""
-    categories = {
-        "validation_errors": [],
-        "processing_errors": [],
-        "system_errors": [],
-        "timeout_errors": [],
-        "access_errors": [],
-    }
-
-    for event in events:
-        message = event.get("message", "").lower()
-        if "validation" in message or "invalid" in message:
-            categories["validation_errors"].append(event)
-        elif "timeout" in message:
-            categories["timeout_errors"].append(event)
-        elif "access" in message or "denied" in message:
-            categories["access_errors"].append(event)
-        elif "exception" in message or "error" in message:
-            categories["processing_errors"].append(event)
-        else:
-            categories["system_errors"].append(event)
-
-    return categories
+def _categorize_message(message: str) -> str:
+    """Return the error category for a log message based on content patterns."""
+    found = {match.lastgroup for match in _CATEGORY_PATTERN.finditer(message)}
+    return next((c for c in _CATEGORY_PRIORITY if c in found), "system_errors")
 
 
 def _get_stepfunction_analysis(failed_docs: List[Dict], time_range_hours: int) -> Dict:
@@ -193,23 +220,25 @@ def _get_xray_analysis(stack_name: str, time_range_hours: int) -> Dict:
     return None
 
 
-def _generate_summary(categories: Dict, failed_docs: List, total_estimate: int) -> str:
-    """Create human-readable summary of error analysis with counts and categories."""
-    total_errors = sum(len(errors) for errors in categories.values())
+def _generate_summary(
+    categories: Dict, failed_docs: List, total_estimate: int
+) -> tuple[str, Dict[str, int]]:
+    """Create human-readable summary of error analysis and per-category counts."""
+    counts = {
+        category: len(errors) for category, errors in categories.items() if errors
+    }
 
-    if total_errors == 0:
-        return "No processing errors found in the specified time range"
+    if not counts:
+        return "No processing errors found in the specified time range", counts
 
     summary_parts = [
         f"Found {total_estimate} total errors across {len(failed_docs)} failed documents"
     ]
+    summary_parts.extend(
+        f"{count} {category.replace('_', ' ')}" for category, count in counts.items()
+    )
 
-    for category, errors in categories.items():
-        if errors:
-            category_name = category.replace("_", " ")
-            summary_parts.append(f"{len(errors)} {category_name}")
-
-    return ". ".join(summary_parts)
+    return ". ".join(summary_parts), counts
 
 
 def _generate_recommendations(
@@ -248,27 +277,27 @@ def analyze_general_errors(
     """Analyze system-wide errors across CloudWatch, Step Functions, X-Ray, and DynamoDB."""
     try:
         config = get_config_with_fallback()
-        time_range_hours = safe_int_conversion(time_range_hours)
-        max_log_events = safe_int_conversion(
-            config.get("max_log_events", max_log_events)
+        # Coerce arguments once here; config values are already ints and the
+        # helpers below receive these locals unchanged
+        time_range_hours = safe_int_conversion(
+            time_range_hours, config.get("time_range_hours_default", 24)
+        )
+        max_log_events = config.get(
+            "max_log_events", safe_int_conversion(max_log_events, 5)
         )
 
         tracking_info = dynamodb_table_name()
         if not tracking_info.get("tracking_table_found"):
             return create_error_response("TrackingTable not found")
 
-        # Get error estimate
-        initial_scan = cloudwatch_stack_logs(
-            "ERROR", hours_back=time_range_hours, max_log_events=5, max_log_groups=5
-        )
-        total_errors_estimate = initial_scan.get("total_events_found", 0)
-
         # Collect data
         failed_docs = _get_failed_documents(time_range_hours)
-        error_summary, all_events, total_collected = _collect_log_events(
+        error_summary, categorized_errors, total_collected = _collect_log_events(
             time_range_hours, max_log_events, config
         )
-        categorized_errors = _categorize_errors(all_events)
+
+        # Estimate from the ERROR events already found rather than a separate scan
+        total_errors_estimate = error_summary.get("ERROR", {}).get("count", 0)
 
         # Get analysis
         stepfunction_analysis = _get_stepfunction_analysis(
@@ -277,7 +306,7 @@ def analyze_general_errors(
         xray_analysis = _get_xray_analysis(stack_name, time_range_hours)
 
         # Generate summary and recommendations
-        analysis_summary = _generate_summary(
+        analysis_summary, category_counts = _generate_summary(
             categorized_errors, failed_docs, total_errors_estimate
         )
         recommendations = _generate_recommendations(
@@ -296,16 +325,13 @@ def analyze_general_errors(
                     "total_errors_estimate": total_errors_estimate,
                     "error_categories": {
                         category: {
-                            "count": len(errors),
+                            "count": count,
                             "sample": truncate_message(
-                                errors[0]["message"],
+                                categorized_errors[category][0]["message"],
                                 config.get("max_log_message_length", 200),
-                            )
-                            if errors
-                            else None,
+                            ),
                         }
-                        for category, errors in categorized_errors.items()
-                        if errors
+                        for category, count in category_counts.items()
                     },
                     "error_summary": error_summary,
                 },
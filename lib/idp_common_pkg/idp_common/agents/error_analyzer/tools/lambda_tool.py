@@ -8,7 +8,7 @@ Lambda tools for document context extraction.
 import json
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import boto3
@@ -18,6 +18,37 @@ from ..config import create_error_response, create_response
 
 logger = logging.getLogger(__name__)
 
+# Dominant timestamp format written by the workflow (e.g. 2025-10-22T18:35:40.357Z)
+_UTC_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+# Step Functions event types that carry function details, mapped to their detail field
+_EVENT_DETAIL_KEYS = {
+    "LambdaFunctionSucceeded": "lambdaFunctionSucceededEventDetails",
+    "LambdaFunctionFailed": "lambdaFunctionFailedEventDetails",
+    "LambdaFunctionTimedOut": "lambdaFunctionTimedOutEventDetails",
+    "TaskStateEntered": "stateEnteredEventDetails",
+    "TaskStateExited": "stateExitedEventDetails",
+}
+
+# Field names that may hold a Lambda request ID in JSON event details
+_REQUEST_ID_FIELDS = (
+    "requestId",
+    "request_id",
+    "RequestId",
+    "awsRequestId",
+    "lambdaRequestId",
+)
+
+_lambda_client = None
+
+
+def _get_lambda_client():
+    """Returns a shared Lambda client, created on first use."""
+    global _lambda_client
+    if _lambda_client is None:
+        _lambda_client = boto3.client("lambda")
+    return _lambda_client
+
 
 def get_lookup_function_name() -> str:
     """
@@ -62,26 +93,10 @@ def extract_lambda_request_ids(
         function_name = None
         request_id = None
 
-        if event_type in [
-            "LambdaFunctionSucceeded",
-            "LambdaFunctionFailed",
-            "LambdaFunctionTimedOut",
-            "TaskStateEntered",
-            "TaskStateExited",
-        ]:
+        detail_key = _EVENT_DETAIL_KEYS.get(event_type)
+        if detail_key:
             # Get function name from resource ARN or state name
-            if "LambdaFunction" in event_type:
-                event_detail = (
-                    event.get("lambdaFunctionSucceededEventDetails")
-                    or event.get("lambdaFunctionFailedEventDetails")
-                    or event.get("lambdaFunctionTimedOutEventDetails")
-                )
-            elif "TaskState" in event_type:
-                event_detail = event.get("stateEnteredEventDetails") or event.get(
-                    "stateExitedEventDetails"
-                )
-            else:
-                event_detail = None
+            event_detail = event.get(detail_key)
 
             if event_detail:
                 # Extract function name
@@ -136,8 +151,8 @@ def extract_lambda_request_ids(
 
     result = {
         "function_request_map": function_request_map,
-        "failed_functions": list(set(failed_functions)),
-        "all_request_ids": list(set(all_request_ids)),
+        "failed_functions": list(dict.fromkeys(failed_functions)),
+        "all_request_ids": list(dict.fromkeys(all_request_ids)),
         "primary_failed_function": failed_functions[0] if failed_functions else None,
     }
 
@@ -156,19 +171,14 @@ def _extract_request_id_from_json(json_string: str) -> Optional[str]:
     Returns:
         Request ID string if found, None otherwise
     """
-    if not json_string:
+    # Only parse when a request ID field name appears in the raw string
+    if not json_string or not any(f in json_string for f in _REQUEST_ID_FIELDS):
         return None
 
     try:
         data = json.loads(json_string)
         # Check common request ID field names
-        for field in [
-            "requestId",
-            "request_id",
-            "RequestId",
-            "awsRequestId",
-            "lambdaRequestId",
-        ]:
+        for field in _REQUEST_ID_FIELDS:
             if field in data and data[field]:
                 return str(data[field])
     except (json.JSONDecodeError, TypeError):
@@ -203,6 +213,25 @@ def _extract_request_id_from_string(text: str) -> Optional[str]:
     return None
 
 
+def _parse_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp into a timezone-aware datetime.
+    Tries the dominant UTC "Z" format first and falls back to fromisoformat.
+
+    Args:
+        value: ISO 8601 timestamp string
+
+    Returns:
+        Timezone-aware datetime
+    """
+    try:
+        return datetime.strptime(value, _UTC_TIMESTAMP_FORMAT).replace(
+            tzinfo=timezone.utc
+        )
+    except ValueError:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 @tool
 def lambda_document_context(document_id: str, stack_name: str = "") -> Dict[str, Any]:
     """
@@ -219,7 +248,7 @@ def lambda_document_context(document_id: str, stack_name: str = "") -> Dict[str,
         Dict containing document context, execution details, and timing information
     """
     try:
-        lambda_client = boto3.client("lambda")
+        lambda_client = _get_lambda_client()
         function_name = get_lookup_function_name()
 
         logger.info(
@@ -233,8 +262,8 @@ def lambda_document_context(document_id: str, stack_name: str = "") -> Dict[str,
             Payload=json.dumps({"object_key": document_id}),
         )
 
-        # Parse response
-        payload = json.loads(response["Payload"].read().decode("utf-8"))
+        # Parse response bytes directly - json detects the UTF encoding itself
+        payload = json.loads(response["Payload"].read())
 
         if payload.get("status") == "NOT_FOUND":
             return create_error_response(
@@ -270,14 +299,10 @@ def lambda_document_context(document_id: str, stack_name: str = "") -> Dict[str,
         end_time = None
 
         if timestamps.get("WorkflowStartTime"):
-            start_time = datetime.fromisoformat(
-                timestamps["WorkflowStartTime"].replace("Z", "+00:00")
-            )
+            start_time = _parse_timestamp(timestamps["WorkflowStartTime"])
 
         if timestamps.get("CompletionTime"):
-            end_time = datetime.fromisoformat(
-                timestamps["CompletionTime"].replace("Z", "+00:00")
-            )
+            end_time = _parse_timestamp(timestamps["CompletionTime"])
 
         return create_response(
             {
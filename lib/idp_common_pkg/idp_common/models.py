@@ -521,13 +521,19 @@ class Document:
             logger.error(f"Error building document from S3: {str(e)}")
             raise
 
-    def compress(self, bucket: str, step_name: str = "processing") -> Dict[str, Any]:
+    def compress(
+        self,
+        bucket: str,
+        step_name: str = "processing",
+        document_json: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Store full document in S3 and return lightweight wrapper for Step Functions.
 
         Args:
             bucket: S3 bucket to store the full document
             step_name: Name of the processing step (for unique S3 key)
+            document_json: Already serialized document JSON (avoids re-encoding)
 
         Returns:
             Lightweight wrapper containing essential fields and section IDs for Map step
@@ -545,7 +551,7 @@ class Document:
 
         try:
             # Store full document in S3
-            full_document_json = self.to_json()
+            full_document_json = document_json or self.to_json()
             s3_client.put_object(
                 Bucket=bucket,
                 Key=s3_key,
@@ -688,7 +694,9 @@ class Document:
                 logger.info(
                     f"Document size ({document_size} bytes) exceeds {size_threshold_kb}KB threshold, compressing to S3"
                 )
-            compressed_data = self.compress(working_bucket, step_name)
+            compressed_data = self.compress(
+                working_bucket, step_name, document_json=document_json
+            )
             return compressed_data
         else:
             if logger:
@@ -70,7 +70,8 @@ def get_json_content(s3_uri: str) -> Dict[str, Any]:
         bucket, key = parse_s3_uri(s3_uri)
         s3 = get_s3_client()
         response = s3.get_object(Bucket=bucket, Key=key)
-        return json.loads(response['Body'].read().decode('utf-8'))
+        # json.loads accepts the raw bytes, avoiding an intermediate decoded copy
+        return json.loads(response['Body'].read())
     except Exception as e:
         logger.error(f"Error reading JSON from {s3_uri}: {e}")
         raise
@@ -85,28 +85,35 @@ def merge_metering_data(existing_metering: Dict[str, Any],
     Returns:
         Merged metering data
     """
+    if not new_metering:
+        return existing_metering.copy()
+
     merged = existing_metering.copy()
     
     for service_api, metrics in new_metering.items():
         if isinstance(metrics, dict):
+            if not metrics:
+                continue
+
+            # Copy the per-service dict once so the caller's nested data is not mutated
+            service_metrics = dict(merged.get(service_api, {}))
+            merged[service_api] = service_metrics
+
             for unit, value in metrics.items():
-                if service_api not in merged:
-                    merged[service_api] = {}
-                
                 # Convert both values to numbers to handle string vs int mismatch
                 try:
-                    existing_value = merged[service_api].get(unit, 0)
+                    existing_value = service_metrics.get(unit, 0)
                     # Handle both string and numeric values
                     if isinstance(existing_value, str):
                         existing_value = float(existing_value)
                     if isinstance(value, str):
                         value = float(value)
                     
-                    merged[service_api][unit] = existing_value + value
+                    service_metrics[unit] = existing_value + value
                 except (ValueError, TypeError) as e:
-                    logger.warning(f"Error converting metering values for {service_api}.{unit}: existing={merged[service_api].get(unit)}, new={value}, error={e}")
+                    logger.warning(f"Error converting metering values for {service_api}.{unit}: existing={service_metrics.get(unit)}, new={value}, error={e}")
                     # Fallback to new value if conversion fails
-                    merged[service_api][unit] = value
+                    service_metrics[unit] = value
         else:
             logger.warning(f"Unexpected metering data format for {service_api}: {metrics}")
             
@@ -0,0 +1,97 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for Error Analyzer CloudWatch tool helpers.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from idp_common.agents.error_analyzer.tools.cloudwatch_tool import (
+    _is_error_filter_pattern,
+    _should_exclude_log_event,
+    build_any_term_filter_pattern,
+    search_cloudwatch_logs,
+)
+
+
+@pytest.mark.unit
+class TestBuildAnyTermFilterPattern:
+    """Test building CloudWatch OR filter patterns."""
+
+    def test_prefixes_and_joins_terms(self):
+        """Test each term is prefixed with '?' and terms are space separated."""
+        pattern = build_any_term_filter_pattern(["ERROR", "Exception", "Timeout"])
+
+        assert pattern == "?ERROR ?Exception ?Timeout"
+
+    def test_quotes_terms_with_special_characters(self):
+        """Test terms that are not plain words are double-quoted and escaped."""
+        pattern = build_any_term_filter_pattern(["[ERROR]", "Task timed out", 'a"b'])
+
+        assert pattern == '?"[ERROR]" ?"Task timed out" ?"a\\"b"'
+
+    def test_skips_empty_terms(self):
+        """Test empty terms are dropped rather than emitted as a bare '?'."""
+        assert build_any_term_filter_pattern(["ERROR", "", "Failed"]) == (
+            "?ERROR ?Failed"
+        )
+
+    def test_accepts_generator(self):
+        """Test any iterable of terms is accepted."""
+        terms = (term for term in ["ERROR", "Exception"])
+
+        assert build_any_term_filter_pattern(terms) == "?ERROR ?Exception"
+
+    def test_empty_terms(self):
+        """Test no terms produce an empty pattern."""
+        assert build_any_term_filter_pattern([]) == ""
+
+
+@pytest.mark.unit
+class TestErrorFilterPatternHandling:
+    """Test combined OR patterns are treated as error searches."""
+
+    def test_combined_pattern_is_error_pattern(self):
+        """Test patterns built from '?term' alternatives count as error searches."""
+        assert _is_error_filter_pattern("?ERROR ?Exception")
+        assert _is_error_filter_pattern('?"[ERROR]" ?"Task timed out"')
+        assert _is_error_filter_pattern("Exception")
+        assert not _is_error_filter_pattern("")
+        assert not _is_error_filter_pattern("abc-123 ?ERROR")
+
+    def test_combined_pattern_excludes_info_and_system_lines(self):
+        """Test INFO and Lambda system lines are dropped for combined patterns."""
+        pattern = "?ERROR ?Exception"
+
+        assert _should_exclude_log_event("[INFO] no ERROR here", pattern)
+        assert _should_exclude_log_event("REPORT RequestId: abc", pattern)
+        assert not _should_exclude_log_event("[ERROR] boom Exception", pattern)
+
+    def test_search_overfetches_and_filters_combined_pattern(self):
+        """Test combined pattern searches fetch 5x events and skip INFO lines."""
+        client = MagicMock()
+        client.filter_log_events.return_value = {
+            "events": [
+                {"timestamp": 1, "message": "[INFO] ERROR count is 0"},
+                {"timestamp": 2, "message": "[ERROR] ValueError", "logStreamName": "s"},
+                {"timestamp": 3, "message": "Exception: boom", "logStreamName": "s"},
+            ]
+        }
+
+        with patch(
+            "idp_common.agents.error_analyzer.tools.cloudwatch_tool._get_logs_client",
+            return_value=client,
+        ):
+            result = search_cloudwatch_logs(
+                log_group_name="/aws/lambda/test",
+                filter_pattern="?ERROR ?Exception",
+                max_events=2,
+            )
+
+        assert client.filter_log_events.call_args.kwargs["limit"] == 10
+        assert [e["message"] for e in result["events"]] == [
+            "[ERROR] ValueError",
+            "Exception: boom",
+        ]
@@ -0,0 +1,279 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for Error Analyzer DynamoDB tracking table tools.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from idp_common.agents.error_analyzer.tools import dynamodb_tool
+from idp_common.agents.error_analyzer.tools.dynamodb_tool import (
+    BATCH_GET_MAX_ATTEMPTS,
+    MAX_QUERY_PAGES,
+    _find_status_index,
+    _get_documents_with_status,
+    _query_list_partitions,
+)
+from moto import mock_aws
+
+TABLE_NAME = "test-tracking-table"
+START_TIME = datetime(2024, 1, 15)
+END_TIME = datetime(2024, 1, 16)
+
+
+def _put_document(table, object_key, status, queued_time):
+    """Write a document record and its list partition entry like the resolvers do."""
+    table.put_item(
+        Item={
+            "PK": f"doc#{object_key}",
+            "SK": "none",
+            "ObjectKey": object_key,
+            "ObjectStatus": status,
+            "QueuedTime": queued_time,
+        }
+    )
+    shard = int(queued_time[11:13]) // 4
+    table.put_item(
+        Item={
+            "PK": f"list#{queued_time[:10]}#s#{shard:02d}",
+            "SK": f"ts#{queued_time}#id#{object_key}",
+            "ObjectKey": object_key,
+            "QueuedTime": queued_time,
+            "ExpiresAfter": 1735689600,
+        }
+    )
+
+
+@pytest.mark.unit
+class TestQueryListPartitions:
+    """Test querying the tracking table by hourly list partition."""
+
+    @pytest.fixture
+    def dynamodb(self):
+        with mock_aws():
+            dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+            table = dynamodb.create_table(
+                TableName=TABLE_NAME,
+                KeySchema=[
+                    {"AttributeName": "PK", "KeyType": "HASH"},
+                    {"AttributeName": "SK", "KeyType": "RANGE"},
+                ],
+                AttributeDefinitions=[
+                    {"AttributeName": "PK", "AttributeType": "S"},
+                    {"AttributeName": "SK", "AttributeType": "S"},
+                ],
+                BillingMode="PAY_PER_REQUEST",
+            )
+            _put_document(table, "a.pdf", "FAILED", "2024-01-15T10:05:00+00:00")
+            _put_document(table, "b.pdf", "COMPLETED", "2024-01-15T10:20:00+00:00")
+            _put_document(table, "c.pdf", "FAILED", "2024-01-15T17:45:00+00:00")
+            yield dynamodb
+
+    def test_status_filter_resolves_list_items_to_documents(self, dynamodb):
+        """Test status filtering reads ObjectStatus from the doc# records."""
+        items = _query_list_partitions(
+            dynamodb, TABLE_NAME, START_TIME, END_TIME, limit=100, status="FAILED"
+        )
+
+        assert [item["ObjectKey"] for item in items] == ["a.pdf", "c.pdf"]
+        assert all(item["ObjectStatus"] == "FAILED" for item in items)
+        assert all(item["PK"].startswith("doc#") for item in items)
+
+    def test_without_status_returns_list_items(self, dynamodb):
+        """Test unfiltered queries return every list partition entry."""
+        items = _query_list_partitions(
+            dynamodb, TABLE_NAME, START_TIME, END_TIME, limit=100
+        )
+
+        assert len(items) == 3
+        assert all(item["PK"].startswith("list#") for item in items)
+
+
+@pytest.mark.unit
+class TestGetDocumentsWithStatus:
+    """Test resolving list items to document records with BatchGetItem."""
+
+    LIST_ITEMS = [{"ObjectKey": "a.pdf"}, {"ObjectKey": "b.pdf"}]
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        with patch(
+            "idp_common.agents.error_analyzer.tools.dynamodb_tool.time.sleep"
+        ) as mock_sleep:
+            yield mock_sleep
+
+    @staticmethod
+    def _document(object_key, status="FAILED"):
+        return {
+            "PK": f"doc#{object_key}",
+            "ObjectKey": object_key,
+            "ObjectStatus": status,
+        }
+
+    def test_retries_unprocessed_keys_and_merges_records(self, no_sleep):
+        """Test unprocessed keys are retried after a backoff and results merged."""
+        unprocessed = {TABLE_NAME: {"Keys": [{"PK": "doc#b.pdf", "SK": "none"}]}}
+        dynamodb = MagicMock()
+        dynamodb.batch_get_item.side_effect = [
+            {
+                "Responses": {TABLE_NAME: [self._document("a.pdf")]},
+                "UnprocessedKeys": unprocessed,
+            },
+            {"Responses": {TABLE_NAME: [self._document("b.pdf")]}},
+        ]
+
+        documents = _get_documents_with_status(
+            dynamodb, TABLE_NAME, self.LIST_ITEMS, "FAILED"
+        )
+
+        assert [d["ObjectKey"] for d in documents] == ["a.pdf", "b.pdf"]
+        assert dynamodb.batch_get_item.call_count == 2
+        assert dynamodb.batch_get_item.call_args.kwargs["RequestItems"] == unprocessed
+        assert no_sleep.call_count == 1
+
+    def test_returns_partial_result_after_max_attempts(self, no_sleep):
+        """Test retries stop after the attempt limit and processed records are kept."""
+        unprocessed = {TABLE_NAME: {"Keys": [{"PK": "doc#b.pdf", "SK": "none"}]}}
+        dynamodb = MagicMock()
+        dynamodb.batch_get_item.side_effect = [
+            {
+                "Responses": {TABLE_NAME: [self._document("a.pdf")]},
+                "UnprocessedKeys": unprocessed,
+            }
+        ] + [{"Responses": {TABLE_NAME: []}, "UnprocessedKeys": unprocessed}] * (
+            BATCH_GET_MAX_ATTEMPTS - 1
+        )
+
+        documents = _get_documents_with_status(
+            dynamodb, TABLE_NAME, self.LIST_ITEMS, "FAILED"
+        )
+
+        assert [d["ObjectKey"] for d in documents] == ["a.pdf"]
+        assert dynamodb.batch_get_item.call_count == BATCH_GET_MAX_ATTEMPTS
+        assert no_sleep.call_count == BATCH_GET_MAX_ATTEMPTS - 1
+        assert all(0 <= c.args[0] <= 1 for c in no_sleep.call_args_list)
+
+
+@pytest.mark.unit
+class TestQueryListPartitionsPagination:
+    """Test paging through list partitions."""
+
+    def _query(self, responses, limit=100):
+        dynamodb = MagicMock()
+        table = dynamodb.Table.return_value
+        table.query.side_effect = responses
+        items = _query_list_partitions(
+            dynamodb, TABLE_NAME, START_TIME, END_TIME, limit=limit
+        )
+        return items, table.query
+
+    def test_reads_one_page_per_exhausted_partition(self):
+        """Test each hour partition is queried once when it fits in one page."""
+        responses = [{"Items": [{"ObjectKey": f"{i}.pdf"}]} for i in range(24)]
+
+        items, query = self._query(responses)
+
+        assert len(items) == 24
+        assert query.call_count == 24
+
+    def test_follow_up_pages_share_one_budget(self):
+        """Test follow-up pages are capped across all partitions, not per hour."""
+        page = {"Items": [], "LastEvaluatedKey": {"PK": "p", "SK": "s"}}
+
+        _, query = self._query(lambda **kwargs: page)
+
+        assert query.call_count == 24 + MAX_QUERY_PAGES
+        assert "ExclusiveStartKey" in query.call_args_list[1].kwargs
+        # Later partitions are still read once the budget is spent
+        last_pk = query.call_args.kwargs["ExpressionAttributeValues"][":pk"]
+        assert last_pk == "list#2024-01-15#s#05"
+
+    def test_stops_paging_at_limit(self):
+        """Test no further pages or partitions are read once the limit is met."""
+        page = {
+            "Items": [{"ObjectKey": f"{i}.pdf"} for i in range(5)],
+            "LastEvaluatedKey": {"PK": "p", "SK": "s"},
+        }
+
+        items, query = self._query(lambda **kwargs: page, limit=5)
+
+        assert len(items) == 5
+        assert query.call_count == 1
+        assert query.call_args.kwargs["Limit"] == 5
+
+
+@pytest.mark.unit
+class TestFindStatusIndex:
+    """Test detecting and caching an ObjectStatus GSI."""
+
+    @pytest.fixture(autouse=True)
+    def client(self, monkeypatch):
+        monkeypatch.setattr(dynamodb_tool, "_status_index_cache", {})
+        with patch(
+            "idp_common.agents.error_analyzer.tools.dynamodb_tool.boto3.client"
+        ) as mock_client:
+            yield mock_client.return_value
+
+    def test_finds_status_index(self, client):
+        """Test the ObjectStatus index and its range key are returned and cached."""
+        client.describe_table.return_value = {
+            "Table": {
+                "GlobalSecondaryIndexes": [
+                    {
+                        "IndexName": "ByQueuedTime",
+                        "KeySchema": [
+                            {"AttributeName": "QueuedTime", "KeyType": "HASH"}
+                        ],
+                    },
+                    {
+                        "IndexName": "ByStatus",
+                        "KeySchema": [
+                            {"AttributeName": "ObjectStatus", "KeyType": "HASH"},
+                            {"AttributeName": "CompletionTime", "KeyType": "RANGE"},
+                        ],
+                    },
+                ]
+            }
+        }
+
+        assert _find_status_index(TABLE_NAME) == ("ByStatus", "CompletionTime")
+        assert _find_status_index(TABLE_NAME) == ("ByStatus", "CompletionTime")
+        assert client.describe_table.call_count == 1
+
+    def test_no_status_index(self, client):
+        """Test tables without an ObjectStatus index return None and are cached."""
+        client.describe_table.return_value = {"Table": {}}
+
+        assert _find_status_index(TABLE_NAME) is None
+        assert _find_status_index(TABLE_NAME) is None
+        assert client.describe_table.call_count == 1
+
+    def test_describe_failure_is_not_cached(self, client):
+        """Test a failed describe_table call is retried on the next lookup."""
+        client.describe_table.side_effect = [
+            ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "slow down"}},
+                "DescribeTable",
+            ),
+            {
+                "Table": {
+                    "GlobalSecondaryIndexes": [
+                        {
+                            "IndexName": "ByStatus",
+                            "KeySchema": [
+                                {"AttributeName": "ObjectStatus", "KeyType": "HASH"}
+                            ],
+                        }
+                    ]
+                }
+            },
+        ]
+
+        assert _find_status_index(TABLE_NAME) is None
+        assert _find_status_index(TABLE_NAME) == ("ByStatus", None)
+        assert client.describe_table.call_count == 2
@@ -0,0 +1,65 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for Error Analyzer general analysis log collection.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from idp_common.agents.error_analyzer.tools.general_analysis_tool import (
+    _collect_log_events,
+)
+
+
+def _event(timestamp, message):
+    return {"timestamp": timestamp, "message": message, "log_stream": "stream"}
+
+
+@pytest.mark.unit
+class TestCollectLogEvents:
+    """Test partitioning combined CloudWatch results by error pattern."""
+
+    def _collect(self, events, max_log_events=20):
+        with patch(
+            "idp_common.agents.error_analyzer.tools.general_analysis_tool.cloudwatch_stack_logs",
+            return_value={"results": [{"log_group": "g", "events": events}]},
+        ) as mock_stack_logs:
+            result = _collect_log_events(24, max_log_events, {})
+        return result, mock_stack_logs
+
+    def test_event_counts_toward_every_matching_pattern(self):
+        """Test specific patterns are filled even when broader ones also match."""
+        events = [
+            _event("t1", "[ERROR] ValidationException: bad input"),
+            _event("t2", "Exception: boom"),
+            _event("t3", "Task Failed after Timeout"),
+        ]
+
+        (error_summary, _, _), _ = self._collect(events)
+
+        assert error_summary["ERROR"]["count"] == 1
+        assert error_summary["Exception"]["count"] == 2
+        assert error_summary["ValidationException"]["count"] == 1
+        assert error_summary["Failed"]["count"] == 1
+        assert error_summary["Timeout"]["count"] == 1
+
+    def test_requests_budget_for_all_patterns_per_log_group(self):
+        """Test each log group is searched for enough events to fill all patterns."""
+        _, mock_stack_logs = self._collect([], max_log_events=20)
+        assert mock_stack_logs.call_args.kwargs["max_log_events"] == 13
+
+        _, mock_stack_logs = self._collect([], max_log_events=2)
+        assert mock_stack_logs.call_args.kwargs["max_log_events"] == 9
+
+    def test_total_samples_capped_by_max_log_events(self):
+        """Test sample events stop once max_log_events is reached."""
+        events = [_event(f"t{i}", f"[ERROR] failure {i} Exception") for i in range(6)]
+
+        (error_summary, _, total), _ = self._collect(events, max_log_events=6)
+
+        assert total == 6
+        assert len(error_summary["ERROR"]["sample_events"]) == 5
+        assert len(error_summary["Exception"]["sample_events"]) == 1
+        assert "Timeout" not in error_summary
@@ -163,6 +163,34 @@ class TestDocumentCompression:
         assert restored_document.input_key == self.document.input_key
         assert restored_document.output_bucket == self.document.output_bucket
 
+    @mock_aws
+    def test_round_trip_with_precomputed_json(self):
+        """Test compress with precomputed JSON -> decompress preserves document data."""
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket=self.bucket)
+        self.document.metering = {"tokens": 1500, "pages": 2}
+
+        document_json = json.dumps(self.document.to_dict(), default=str)
+        compressed_data = self.document.compress(
+            self.bucket, "extraction", document_json=document_json
+        )
+        restored_document = Document.decompress(self.bucket, compressed_data)
+
+        assert restored_document.to_dict() == self.document.to_dict()
+
+    @mock_aws
+    def test_serialize_document_round_trip(self):
+        """Test serialize_document output decompresses back to the same document."""
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket=self.bucket)
+        self.document.metering = {"tokens": 1500, "pages": 2}
+
+        serialized = self.document.serialize_document(self.bucket, "assessment")
+        restored_document = Document.load_document(serialized, self.bucket)
+
+        assert serialized["compressed"] is True
+        assert restored_document.to_dict() == self.document.to_dict()
+
     def test_section_ids_preserved_in_compressed_data(self):
         """Test that section IDs are preserved in compressed wrapper for Map step."""
         with patch("boto3.client") as mock_boto3:
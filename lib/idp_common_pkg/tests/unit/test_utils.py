@@ -13,6 +13,7 @@ from idp_common.utils import (
     extract_json_from_text,
     extract_structured_data_from_text,
     extract_yaml_from_text,
+    merge_metering_data,
 )
 
 # Import yaml with fallback for testing
@@ -727,3 +728,66 @@ class TestYamlNotAvailable:
         parsed_data, detected_format = extract_structured_data_from_text(yaml_text)
         assert detected_format == "unknown"
         assert parsed_data == yaml_text
+
+
+@pytest.mark.unit
+class TestMergeMeteringData:
+    """Tests for the merge_metering_data function."""
+
+    def test_merges_totals(self):
+        """Test matching units are summed and new services and units are added."""
+        existing = {
+            "Assessment/bedrock/model": {"inputTokens": 100, "outputTokens": 20},
+            "OCR/textract/analyze_document": {"pages": 2},
+        }
+        new = {
+            "Assessment/bedrock/model": {"inputTokens": 50, "cacheReadInputTokens": 5},
+            "Assessment/lambda/duration": {"gb_seconds": 1.5},
+        }
+
+        merged = merge_metering_data(existing, new)
+
+        assert merged == {
+            "Assessment/bedrock/model": {
+                "inputTokens": 150,
+                "outputTokens": 20,
+                "cacheReadInputTokens": 5,
+            },
+            "OCR/textract/analyze_document": {"pages": 2},
+            "Assessment/lambda/duration": {"gb_seconds": 1.5},
+        }
+
+    def test_converts_string_values(self):
+        """Test string values are converted to numbers before summing."""
+        merged = merge_metering_data({"svc": {"pages": "2"}}, {"svc": {"pages": 3}})
+
+        assert merged == {"svc": {"pages": 5.0}}
+
+    def test_does_not_mutate_inputs(self):
+        """Test neither input, nor their nested service dicts, are modified."""
+        existing = {"svc": {"pages": 1}}
+        new = {"svc": {"pages": 2}, "other": {"pages": 4}}
+
+        merged = merge_metering_data(existing, new)
+        merged["svc"]["pages"] = 99
+        merged["other"]["pages"] = 99
+
+        assert existing == {"svc": {"pages": 1}}
+        assert new == {"svc": {"pages": 2}, "other": {"pages": 4}}
+
+    def test_empty_new_metering_returns_copy(self):
+        """Test an empty update returns a copy of the existing metering."""
+        existing = {"svc": {"pages": 1}}
+
+        merged = merge_metering_data(existing, {})
+
+        assert merged == existing
+        assert merged is not existing
+
+    def test_skips_empty_and_malformed_services(self):
+        """Test empty service dicts and non-dict values are ignored."""
+        merged = merge_metering_data(
+            {"svc": {"pages": 1}}, {"empty": {}, "bad": "not-a-dict"}
+        )
+
+        assert merged == {"svc": {"pages": 1}}
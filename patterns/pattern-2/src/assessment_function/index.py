@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT-0
 
 import os
+import re
 import json
 import time
 import logging
@@ -14,7 +15,10 @@ from idp_common.utils import normalize_boolean_value, calculate_lambda_metering,
 from assessment_validator import AssessmentValidator
 from aws_xray_sdk.core import xray_recorder, patch_all
 
-patch_all()
+# SDK patching and handler segments follow the stack's EnableXRayTracing setting
+XRAY_ENABLED = os.environ.get('XRAY_ENABLED', 'true').lower() == 'true'
+if XRAY_ENABLED:
+    patch_all()
 
 # Custom exception for throttling scenarios
 class ThrottlingException(Exception):
@@ -41,12 +45,50 @@ THROTTLING_EXCEPTIONS = [
     "RequestLimitExceeded"
 ]
 
-# Configuration will be loaded in handler function
+# Precompiled once so each check is a single case-insensitive scan of the message
+_THROTTLING_RE = re.compile('|'.join(re.escape(k) for k in THROTTLING_KEYWORDS), re.IGNORECASE)
+_THROTTLING_EXCEPTION_SET = frozenset(THROTTLING_EXCEPTIONS)
+
+# Configuration is loaded in the handler through _get_cached_config()
 
 logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
 
+# Initialize settings
+WORKING_BUCKET = os.environ.get('WORKING_BUCKET')
+TRACKING_TABLE = os.environ.get('TRACKING_TABLE')
+
+# Warm-container caches. Configuration is reloaded once CONFIG_CACHE_TTL_SECONDS
+# has elapsed (default 0: reload every invocation so UI config edits apply immediately)
+CONFIG_CACHE_TTL_SECONDS = int(os.environ.get('CONFIG_CACHE_TTL_SECONDS', 0))
+_config = None
+_config_loaded_at = 0.0
+_document_service = None
+
+def _get_cached_config():
+    """Return the configuration, reloading it when the cache TTL has elapsed."""
+    global _config, _config_loaded_at
+    now = time.time()
+    if _config is None or now - _config_loaded_at >= CONFIG_CACHE_TTL_SECONDS:
+        _config = get_config()
+        _config_loaded_at = now
+    return _config
+
+def _get_document_service():
+    """Return the document service, created once per container."""
+    global _document_service
+    if _document_service is None:
+        _document_service = create_document_service()
+    return _document_service
+
+def _short_error(exception, limit=2048):
+    """Format an exception for document.errors, capped at limit characters."""
+    message = f"{type(exception).__name__}: {exception}"
+    if len(message) <= limit:
+        return message
+    return message[:limit] + '...[truncated]'
+
 def is_throttling_exception(exception):
     """
     Check if an exception is related to throttling.
@@ -61,14 +103,11 @@ def is_throttling_exception(exception):
     
     if isinstance(exception, ClientError):
         error_code = exception.response.get('Error', {}).get('Code', '')
-        return error_code in THROTTLING_EXCEPTIONS
-    
-    exception_name = type(exception).__name__
-    exception_message = str(exception).lower()
+        return error_code in _THROTTLING_EXCEPTION_SET
     
     return (
-        exception_name in THROTTLING_EXCEPTIONS or
-        any(keyword in exception_message for keyword in THROTTLING_KEYWORDS)
+        type(exception).__name__ in _THROTTLING_EXCEPTION_SET or
+        _THROTTLING_RE.search(str(exception)) is not None
     )
 
 def check_document_for_throttling_errors(document):
@@ -85,13 +124,25 @@ def check_document_for_throttling_errors(document):
         return False, None
     
     for error_msg in document.errors:
-        error_lower = str(error_msg).lower()
-        if any(keyword in error_lower for keyword in THROTTLING_KEYWORDS):
+        if _THROTTLING_RE.search(str(error_msg)):
             return True, error_msg
     
     return False, None
 
-@xray_recorder.capture('assessment_function')
+def _truncated_json(obj, limit=4096):
+    """Serialize an object for debug logging, truncated to limit characters."""
+    text = json.dumps(obj, default=str)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...<truncated {len(text) - limit} chars>"
+
+def _no_capture(func):
+    """Stand-in for xray_recorder.capture when tracing is disabled."""
+    return func
+
+_capture = xray_recorder.capture('assessment_function') if XRAY_ENABLED else _no_capture
+
+@_capture
 def handler(event, context):
     """
     Lambda handler for document assessment.
@@ -99,12 +150,15 @@ def handler(event, context):
     using the Assessment service from the idp_common library.
     """
     start_time = time.time()  # Capture start time for Lambda metering
-    logger.info(f"Starting assessment processing for event: {json.dumps(event, default=str)}")
+    logger.info(f"Starting assessment processing for section: {event.get('section_id')}")
+    # Full payloads are only serialized when debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Event: {_truncated_json(event)}")
 
     # Load configuration
-    config = get_config()
-    # Use default=str to handle Decimal and other non-serializable types
-    logger.info(f"Config: {json.dumps(config, default=str)}")
+    config = _get_cached_config()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Config: {_truncated_json(config)}")
     
     # Extract input from event - handle both compressed and uncompressed
     document_data = event.get('document', {})
@@ -118,27 +172,23 @@ def handler(event, context):
         raise ValueError("No section_id provided in event")
         
     # Convert document data to Document object - handle compression
-    working_bucket = os.environ.get('WORKING_BUCKET')
-    document = Document.load_document(document_data, working_bucket, logger)
+    document = Document.load_document(document_data, WORKING_BUCKET, logger)
     logger.info(f"Processing assessment for document {document.id}, section {section_id}")
 
     # X-Ray annotations
-    xray_recorder.put_annotation('document_id', {document.id})
-    xray_recorder.put_annotation('processing_stage', 'assessment')
+    if XRAY_ENABLED:
+        xray_recorder.put_annotation('document_id', {document.id})
+        xray_recorder.put_annotation('processing_stage', 'assessment')
 
     # Find the section we're processing
-    section = None
-    for s in document.sections:
-        if s.section_id == section_id:
-            section = s
-            break
+    section = next((s for s in document.sections if s.section_id == section_id), None)
     
     if not section:
         raise ValueError(f"Section {section_id} not found in document")
 
-    # Check if granular assessment is enabled (moved earlier for Lambda metering context)
-    granular_config = config.get('assessment', {}).get('granular', {})
-    granular_enabled = granular_config.get('enabled', False)
+    # Resolve assessment settings once; granular mode also sets the Lambda metering context
+    assessment_config = config.get('assessment', {})
+    granular_enabled = assessment_config.get('granular', {}).get('enabled', False)
     assessment_context = "GranularAssessment" if granular_enabled else "Assessment"
     logger.info(f"Assessment mode: {'Granular' if granular_enabled else 'Regular'} (context: {assessment_context})")
 
@@ -146,55 +196,50 @@ def handler(event, context):
     if section.extraction_result_uri and section.extraction_result_uri.strip():
         try:
             logger.info(f"Checking extraction results for existing assessment: {section.extraction_result_uri}")
-            extraction_data = s3.get_json_content(section.extraction_result_uri)
+            extraction_bytes = s3.get_binary_content(section.extraction_result_uri)
+            # Most sections still need assessment - only parse when the key is present at all
+            extraction_data = {}
+            if b'"explainability_info"' in extraction_bytes:
+                extraction_data = json.loads(extraction_bytes)
             
             # If explainability_info exists, assessment was already done
             if extraction_data.get('explainability_info'):
                 logger.info(f"Skipping assessment for section {section_id} - extraction results already contain explainability_info")
                 
-                # Create section-specific document (same as normal processing) to match output format
-                section_document = Document(
-                    id=document.id,
-                    input_bucket=document.input_bucket,
-                    input_key=document.input_key,
-                    output_bucket=document.output_bucket,
-                    status=Status.ASSESSING,  # Keep status consistent with normal flow
-                    initial_event_time=document.initial_event_time,
-                    queued_time=document.queued_time,
-                    start_time=document.start_time,
-                    completion_time=document.completion_time,
-                    workflow_execution_arn=document.workflow_execution_arn,
-                    num_pages=len(section.page_ids),
-                    summary_report_uri=document.summary_report_uri,
-                    evaluation_status=document.evaluation_status,
-                    evaluation_report_uri=document.evaluation_report_uri,
-                    evaluation_results_uri=document.evaluation_results_uri,
-                    errors=document.errors,
-                    metering={}  # Empty metering for skipped processing
-                )
-                
-                # Add only the pages needed for this section
-                for page_id in section.page_ids:
-                    if page_id in document.pages:
-                        section_document.pages[page_id] = document.pages[page_id]
-                
-                # Add only the section being processed (preserve existing data)
-                section_document.sections = [section]
+                # Trim the incoming document to this section in place (same shape as normal
+                # processing output) rather than copying it into a new Document
+                document.status = Status.ASSESSING  # Keep status consistent with normal flow
+                document.num_pages = len(section.page_ids)
+                document.pages = {
+                    page_id: document.pages[page_id]
+                    for page_id in section.page_ids
+                    if page_id in document.pages
+                }
+                document.sections = [section]
+                document.metering = {}  # Empty metering for skipped processing
+                # Drop fields the section output never carried
+                document.metadata = {}
+                document.trace_id = None
+                document.hitl_metadata = []
+                document.evaluation_result = None
+                document.summarization_result = None
                 
                 # Add Lambda metering for assessment skip execution with dynamic context
                 try:
                     lambda_metering = calculate_lambda_metering(assessment_context, context, start_time)
-                    section_document.metering = merge_metering_data(section_document.metering, lambda_metering)
+                    document.metering = merge_metering_data(document.metering, lambda_metering)
                 except Exception as e:
                     logger.warning(f"Failed to add Lambda metering for assessment skip: {str(e)}")
                 
                 # Return consistent format for Map state collation
                 response = {
                     "section_id": section_id, 
-                    "document": section_document.serialize_document(working_bucket, f"assessment_skip_{section_id}", logger)
+                    "document": document.serialize_document(WORKING_BUCKET, f"assessment_skip_{section_id}", logger)
                 }
                 
-                logger.info(f"Assessment skipped - Response: {json.dumps(response, default=str)}")
+                logger.info("Assessment skipped - returning section document")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Assessment skipped - Response: {_truncated_json(response)}")
                 return response
             else:
                 logger.info(f"Assessment needed for section {section_id} - no explainability_info found in extraction results")
@@ -212,21 +257,15 @@ def handler(event, context):
         input_key=document.input_key,
         status=Status.ASSESSING,
     )
-    document_service = create_document_service()
+    document_service = _get_document_service()
     logger.info(f"Updating document status to {docStatus.status}")
     document_service.update_document(docStatus)
 
     # Initialize assessment service with cache table for enhanced retry handling
-    cache_table = os.environ.get('TRACKING_TABLE')
-    
-    # Check if granular assessment is enabled
-    granular_config = config.get('assessment', {}).get('granular', {})
-    granular_enabled = granular_config.get('enabled', False)
-    
     if granular_enabled:
         # Use enhanced granular assessment service with caching and retry support
         from idp_common.assessment.granular_service import GranularAssessmentService
-        assessment_service = GranularAssessmentService(config=config, cache_table=cache_table)
+        assessment_service = GranularAssessmentService(config=config, cache_table=TRACKING_TABLE)
         logger.info("Using granular assessment service with enhanced error handling and caching")
     else:
         # Use regular assessment service
@@ -276,8 +315,7 @@ def handler(event, context):
         # Check if this is a throttling exception that should trigger retry
         if is_throttling_exception(e):
             logger.error(f"Throttling exception detected: {type(e).__name__}. This will trigger state machine retry.")
-            # Update document status before re-raising
-            document_service.update_document(docStatus)
+            # Status is already ASSESSING from the update above, so no further mutation is needed
             # Re-raise to trigger state machine retry
             raise
         else:
@@ -285,10 +323,12 @@ def handler(event, context):
             # Set document status to failed for non-throttling exceptions
             updated_document = document
             updated_document.status = Status.FAILED
-            updated_document.errors.append(str(e))
+            # Skip duplicates so retried failures don't accumulate the same message
+            error_message = _short_error(e)
+            if error_message not in updated_document.errors:
+                updated_document.errors.append(error_message)
 
     # Assessment validation
-    assessment_config = config.get('assessment', {})
     assessment_enabled = normalize_boolean_value(assessment_config.get('enabled', False))
     validation_enabled = assessment_enabled and normalize_boolean_value(assessment_config.get('validation_enabled', True))
     logger.info(f"Assessment Enabled:{assessment_enabled}")
@@ -298,22 +338,22 @@ def handler(event, context):
     elif not validation_enabled:
         logger.info("Assessment validation is disabled.")
     else:
-        for section in updated_document.sections:
-            if section.section_id == section_id and section.extraction_result_uri:
-                logger.info(f"Loading assessment results from: {section.extraction_result_uri}")
-                # Load extraction data with assessment results
-                extraction_data = s3.get_json_content(section.extraction_result_uri)
-                validator = AssessmentValidator(extraction_data,
-                                                assessment_config=assessment_config,
-                                                enable_missing_check=True,
-                                                enable_count_check=True)
-                validation_results = validator.validate_all()
-                if not validation_results['is_valid']:
-                    # Handle validation failure
-                    updated_document.status = Status.FAILED
-                    validation_errors = validation_results['validation_errors']
-                    updated_document.errors.extend(validation_errors)
-                    logger.error(f"Validation Error: {validation_errors}")
+        section = next((s for s in updated_document.sections if s.section_id == section_id), None)
+        if section and section.extraction_result_uri:
+            logger.info(f"Loading assessment results from: {section.extraction_result_uri}")
+            # Load extraction data with assessment results
+            extraction_data = s3.get_json_content(section.extraction_result_uri)
+            validator = AssessmentValidator(extraction_data,
+                                            assessment_config=assessment_config,
+                                            enable_missing_check=True,
+                                            enable_count_check=True)
+            validation_results = validator.validate_all()
+            if not validation_results['is_valid']:
+                # Handle validation failure
+                updated_document.status = Status.FAILED
+                validation_errors = validation_results['validation_errors']
+                updated_document.errors.extend(validation_errors)
+                logger.error(f"Validation Error: {validation_errors}")
 
     # Add Lambda metering for successful assessment execution with dynamic context
     try:
@@ -324,7 +364,7 @@ def handler(event, context):
 
     # Prepare output with automatic compression if needed
     result = {
-        'document': updated_document.serialize_document(working_bucket, f"assessment_{section_id}", logger),
+        'document': updated_document.serialize_document(WORKING_BUCKET, f"assessment_{section_id}", logger),
         'section_id': section_id
     }
     
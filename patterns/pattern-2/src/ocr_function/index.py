@@ -6,6 +6,7 @@ OCR function that processes PDFs and extracts text using AWS Textract.
 Uses the idp_common.ocr package for OCR functionality.
 """
 
+import hashlib
 import json
 import logging
 import os
@@ -17,9 +18,12 @@ from idp_common.docs_service import create_document_service
 from idp_common.utils import calculate_lambda_metering, merge_metering_data
 from aws_xray_sdk.core import xray_recorder, patch_all
 
-patch_all()
+# SDK patching and handler segments follow the stack's EnableXRayTracing setting
+XRAY_ENABLED = os.environ.get('XRAY_ENABLED', 'true').lower() == 'true'
+if XRAY_ENABLED:
+    patch_all()
 
-# Configuration will be loaded in handler function
+# Configuration is loaded in the handler through _get_cached_config()
 
 logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
@@ -29,29 +33,91 @@ logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_
 region = os.environ['AWS_REGION']
 METRIC_NAMESPACE = os.environ.get('METRIC_NAMESPACE')
 MAX_WORKERS = int(os.environ.get('MAX_WORKERS', 20))
+WORKING_BUCKET = os.environ.get('WORKING_BUCKET')
 
-@xray_recorder.capture('ocr_function')
+# Warm-container caches. Configuration is reloaded once CONFIG_CACHE_TTL_SECONDS
+# has elapsed (default 0: reload every invocation so UI config edits apply immediately)
+CONFIG_CACHE_TTL_SECONDS = int(os.environ.get('CONFIG_CACHE_TTL_SECONDS', 0))
+_config = None
+_config_loaded_at = 0.0
+_document_service = None
+
+def _get_cached_config():
+    """Return the configuration, reloading it when the cache TTL has elapsed."""
+    global _config, _config_loaded_at
+    now = time.time()
+    if _config is None or now - _config_loaded_at >= CONFIG_CACHE_TTL_SECONDS:
+        _config = get_config()
+        _config_loaded_at = now
+    return _config
+
+def _get_document_service():
+    """Return the document service, created once per container."""
+    global _document_service
+    if _document_service is None:
+        _document_service = create_document_service()
+    return _document_service
+
+_ocr_service = None
+_ocr_service_key = None
+
+def _get_ocr_service(config, backend):
+    """Return an OCR service, rebuilt only when the configuration or backend changes."""
+    global _ocr_service, _ocr_service_key
+    # Configuration is reloaded every invocation by default, so compare a stable
+    # hash of its content rather than the object itself
+    config_hash = hashlib.sha256(
+        json.dumps(config, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+    service_key = (backend, config_hash)
+    if _ocr_service is None or _ocr_service_key != service_key:
+        _ocr_service = ocr.OcrService(
+            region=region,
+            config=config,
+            backend=backend
+        )
+        _ocr_service_key = service_key
+    return _ocr_service
+
+def _truncated_json(obj, limit=4096):
+    """Serialize an object for debug logging, truncated to limit characters."""
+    text = json.dumps(obj, default=str)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...<truncated {len(text) - limit} chars>"
+
+def _no_capture(func):
+    """Stand-in for xray_recorder.capture when tracing is disabled."""
+    return func
+
+_capture = xray_recorder.capture('ocr_function') if XRAY_ENABLED else _no_capture
+
+@_capture
 def handler(event, context): 
     """
     Lambda handler for OCR processing.
     """
     start_time = time.time()  # Capture start time for Lambda metering
-    logger.info(f"Event: {json.dumps(event)}")
+    logger.info(f"Event keys: {list(event.keys())}")
+    # Full payloads are only serialized when debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Event: {_truncated_json(event)}")
     
     # Get document from event - handle both compressed and uncompressed
-    working_bucket = os.environ.get('WORKING_BUCKET')
-    document = Document.load_document(event["document"], working_bucket, logger)
+    document = Document.load_document(event["document"], WORKING_BUCKET, logger)
     
     # Log loaded document for troubleshooting
     logger.info(f"Loaded document - ID: {document.id}, input_key: {document.input_key}")
     logger.info(f"Document buckets - input_bucket: {document.input_bucket}, output_bucket: {document.output_bucket}")
     logger.info(f"Document status: {document.status}, num_pages: {document.num_pages}")
     logger.info(f"Document pages count: {len(document.pages)}, sections count: {len(document.sections)}")
-    logger.info(f"Full document content: {json.dumps(document.to_dict(), default=str)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Full document content: {_truncated_json(document.to_dict())}")
     
     # X-Ray annotations
-    xray_recorder.put_annotation('document_id', {document.id})
-    xray_recorder.put_annotation('processing_stage', 'ocr')
+    if XRAY_ENABLED:
+        xray_recorder.put_annotation('document_id', {document.id})
+        xray_recorder.put_annotation('processing_stage', 'ocr')
 
     # Intelligent OCR detection: Skip if pages already have OCR data
     pages_with_ocr = 0
@@ -67,7 +133,7 @@ def handler(event, context):
         
         # Update document execution ARN for tracking
         if document.status == Status.QUEUED:
-            document_service = create_document_service()
+            document_service = _get_document_service()
             logger.info(f"Updating document execution ARN for OCR skip")
             document_service.update_document(document)
         
@@ -79,34 +145,31 @@ def handler(event, context):
             logger.warning(f"Failed to add Lambda metering for OCR skip: {str(e)}")
         
         # Prepare output with existing document data
-        working_bucket = os.environ.get('WORKING_BUCKET')
         response = {
-            "document": document.serialize_document(working_bucket, "ocr_skip", logger)
+            "document": document.serialize_document(WORKING_BUCKET, "ocr_skip", logger)
         }
         
-        logger.info(f"OCR skipped - Response: {json.dumps(response, default=str)}")
+        logger.info("OCR skipped - returning document")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"OCR skipped - Response: {_truncated_json(response)}")
         return response
     
     # Normal OCR processing
     # Update document status to OCR and update in AppSync
     document.status = Status.OCR
     document.workflow_execution_arn = event.get("execution_arn")
-    document_service = create_document_service()
+    document_service = _get_document_service()
     logger.info(f"Updating document status to {document.status}")
     document_service.update_document(document)
     
     t0 = time.time()
     
     # Load configuration and initialize the OCR service using new simplified pattern
-    config = get_config()
+    config = _get_cached_config()
     backend = config.get("ocr", {}).get("backend", "textract")
     
     logger.info(f"Initializing OCR with backend: {backend}")
-    service = ocr.OcrService(
-        region=region,
-        config=config,
-        backend=backend
-    )
+    service = _get_ocr_service(config, backend)
     
     # Process the document - the service will read the PDF content directly
     document = service.process_document(document)
@@ -130,10 +193,11 @@ def handler(event, context):
         logger.warning(f"Failed to add Lambda metering for OCR: {str(e)}")
     
     # Prepare output with automatic compression if needed
-    working_bucket = os.environ.get('WORKING_BUCKET')
     response = {
-        "document": document.serialize_document(working_bucket, "ocr", logger)
+        "document": document.serialize_document(WORKING_BUCKET, "ocr", logger)
     }
     
-    logger.info(f"Response: {json.dumps(response, default=str)}")
+    logger.info("OCR processing completed")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Response: {_truncated_json(response)}")
     return response
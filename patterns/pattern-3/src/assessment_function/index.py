@@ -11,12 +11,45 @@ from idp_common.models import Document, Status
 from idp_common.docs_service import create_document_service
 from idp_common.utils import calculate_lambda_metering, merge_metering_data
 
-# Configuration will be loaded in handler function
+# Configuration is loaded in the handler through _get_cached_config()
 
 logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
 
+# Initialize settings
+WORKING_BUCKET = os.environ.get('WORKING_BUCKET')
+
+# Warm-container caches. Configuration is reloaded once CONFIG_CACHE_TTL_SECONDS
+# has elapsed (default 0: reload every invocation so UI config edits apply immediately)
+CONFIG_CACHE_TTL_SECONDS = int(os.environ.get('CONFIG_CACHE_TTL_SECONDS', 0))
+_config = None
+_config_loaded_at = 0.0
+_document_service = None
+
+def _get_cached_config():
+    """Return the configuration, reloading it when the cache TTL has elapsed."""
+    global _config, _config_loaded_at
+    now = time.time()
+    if _config is None or now - _config_loaded_at >= CONFIG_CACHE_TTL_SECONDS:
+        _config = get_config()
+        _config_loaded_at = now
+    return _config
+
+def _get_document_service():
+    """Return the document service, created once per container."""
+    global _document_service
+    if _document_service is None:
+        _document_service = create_document_service()
+    return _document_service
+
+def _truncated_json(obj, limit=4096):
+    """Serialize an object for debug logging, truncated to limit characters."""
+    text = json.dumps(obj, default=str)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...<truncated {len(text) - limit} chars>"
+
 def handler(event, context):
     """
     Lambda handler for document assessment.
@@ -24,11 +57,15 @@ def handler(event, context):
     using the Assessment service from the idp_common library.
     """
     start_time = time.time()  # Capture start time for Lambda metering
-    logger.info(f"Starting assessment processing for event: {json.dumps(event, default=str)}")
+    logger.info(f"Starting assessment processing for section: {event.get('section_id')}")
+    # Full payloads are only serialized when debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Event: {_truncated_json(event)}")
 
     # Load configuration
-    config = get_config()
-    logger.info(f"Config: {json.dumps(config, default=str)}")
+    config = _get_cached_config()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Config: {_truncated_json(config)}")
     
     # Extract input from event - handle both compressed and uncompressed
     document_data = event.get('document', {})
@@ -42,16 +79,11 @@ def handler(event, context):
         raise ValueError("No section_id provided in event")
         
     # Convert document data to Document object - handle compression
-    working_bucket = os.environ.get('WORKING_BUCKET')
-    document = Document.load_document(document_data, working_bucket, logger)
+    document = Document.load_document(document_data, WORKING_BUCKET, logger)
     logger.info(f"Processing assessment for document {document.id}, section {section_id}")
 
     # Find the section we're processing
-    section = None
-    for s in document.sections:
-        if s.section_id == section_id:
-            section = s
-            break
+    section = next((s for s in document.sections if s.section_id == section_id), None)
     
     if not section:
         raise ValueError(f"Section {section_id} not found in document")
@@ -67,55 +99,50 @@ def handler(event, context):
         try:
             from idp_common import s3
             logger.info(f"Checking extraction results for existing assessment: {section.extraction_result_uri}")
-            extraction_data = s3.get_json_content(section.extraction_result_uri)
+            extraction_bytes = s3.get_binary_content(section.extraction_result_uri)
+            # Most sections still need assessment - only parse when the key is present at all
+            extraction_data = {}
+            if b'"explainability_info"' in extraction_bytes:
+                extraction_data = json.loads(extraction_bytes)
             
             # If explainability_info exists, assessment was already done
             if extraction_data.get('explainability_info'):
                 logger.info(f"Skipping assessment for section {section_id} - extraction results already contain explainability_info")
                 
-                # Create section-specific document (same as normal processing) to match output format
-                section_document = Document(
-                    id=document.id,
-                    input_bucket=document.input_bucket,
-                    input_key=document.input_key,
-                    output_bucket=document.output_bucket,
-                    status=Status.ASSESSING,  # Keep status consistent with normal flow
-                    initial_event_time=document.initial_event_time,
-                    queued_time=document.queued_time,
-                    start_time=document.start_time,
-                    completion_time=document.completion_time,
-                    workflow_execution_arn=document.workflow_execution_arn,
-                    num_pages=len(section.page_ids),
-                    summary_report_uri=document.summary_report_uri,
-                    evaluation_status=document.evaluation_status,
-                    evaluation_report_uri=document.evaluation_report_uri,
-                    evaluation_results_uri=document.evaluation_results_uri,
-                    errors=document.errors,
-                    metering={}  # Empty metering for skipped processing
-                )
-                
-                # Add only the pages needed for this section
-                for page_id in section.page_ids:
-                    if page_id in document.pages:
-                        section_document.pages[page_id] = document.pages[page_id]
-                
-                # Add only the section being processed (preserve existing data)
-                section_document.sections = [section]
+                # Trim the incoming document to this section in place (same shape as normal
+                # processing output) rather than copying it into a new Document
+                document.status = Status.ASSESSING  # Keep status consistent with normal flow
+                document.num_pages = len(section.page_ids)
+                document.pages = {
+                    page_id: document.pages[page_id]
+                    for page_id in section.page_ids
+                    if page_id in document.pages
+                }
+                document.sections = [section]
+                document.metering = {}  # Empty metering for skipped processing
+                # Drop fields the section output never carried
+                document.metadata = {}
+                document.trace_id = None
+                document.hitl_metadata = []
+                document.evaluation_result = None
+                document.summarization_result = None
                 
                 # Add Lambda metering for assessment skip execution with dynamic context
                 try:
                     lambda_metering = calculate_lambda_metering(assessment_context, context, start_time)
-                    section_document.metering = merge_metering_data(section_document.metering, lambda_metering)
+                    document.metering = merge_metering_data(document.metering, lambda_metering)
                 except Exception as e:
                     logger.warning(f"Failed to add Lambda metering for assessment skip: {str(e)}")
                 
                 # Return consistent format for Map state collation
                 response = {
                     "section_id": section_id, 
-                    "document": section_document.serialize_document(working_bucket, f"assessment_skip_{section_id}", logger)
+                    "document": document.serialize_document(WORKING_BUCKET, f"assessment_skip_{section_id}", logger)
                 }
                 
-                logger.info(f"Assessment skipped - Response: {json.dumps(response, default=str)}")
+                logger.info("Assessment skipped - returning section document")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Assessment skipped - Response: {_truncated_json(response)}")
                 return response
             else:
                 logger.info(f"Assessment needed for section {section_id} - no explainability_info found in extraction results")
@@ -133,7 +160,7 @@ def handler(event, context):
         input_key=document.input_key,
         status=Status.ASSESSING,
     )
-    document_service = create_document_service()
+    document_service = _get_document_service()
     logger.info(f"Updating document status to {docStatus.status}")
     document_service.update_document(docStatus)
 
@@ -162,7 +189,7 @@ def handler(event, context):
     
     # Prepare output with automatic compression if needed
     result = {
-        'document': updated_document.serialize_document(working_bucket, f"assessment_{section_id}", logger),
+        'document': updated_document.serialize_document(WORKING_BUCKET, f"assessment_{section_id}", logger),
         'section_id': section_id
     }
     
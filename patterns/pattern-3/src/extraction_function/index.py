@@ -98,11 +98,11 @@ def handler(event, context):
     section_document.metering = {}
     
     # Filter to keep only the pages needed for this section
-    needed_pages = {}
-    for page_id in section.page_ids:
-        if page_id in full_document.pages:
-            needed_pages[page_id] = full_document.pages[page_id]
-    section_document.pages = needed_pages
+    section_document.pages = {
+        page_id: full_document.pages[page_id]
+        for page_id in section.page_ids
+        if page_id in full_document.pages
+    }
     
     # Initialize the extraction service
     extraction_service = extraction.ExtractionService(config=config)
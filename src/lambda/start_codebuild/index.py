@@ -14,6 +14,8 @@ from crhelper import CfnResource
 
 LOGGER = logging.getLogger(__name__)
 LOG_LEVEL = getenv("LOG_LEVEL", "INFO")
+# BatchDeleteImage accepts at most 100 image IDs per request
+ECR_BATCH_DELETE_LIMIT = 100
 HELPER = CfnResource(
     json_logging=True,
     log_level=LOG_LEVEL,
@@ -160,8 +162,9 @@ def _delete_all_ecr_images(repository_name: str) -> None:
         LOGGER.info("no images found in repository %s", repository_name)
         return
 
-    for chunk_start in range(0, len(images_to_delete), 100):
-        chunk = images_to_delete[chunk_start : chunk_start + 100]
+    # Images are listed in full before deleting so pagination is not disturbed
+    for chunk_start in range(0, len(images_to_delete), ECR_BATCH_DELETE_LIMIT):
+        chunk = images_to_delete[chunk_start : chunk_start + ECR_BATCH_DELETE_LIMIT]
         LOGGER.debug(
             "deleting %s images from repository %s",
             len(chunk),